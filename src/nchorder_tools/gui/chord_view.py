@@ -4,7 +4,9 @@ Chord Layout Viewer and Editor
 Displays chord mappings in a tree view organized by button hierarchy.
 """
 
+import bisect
 import struct
+from itertools import starmap
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
@@ -38,6 +40,20 @@ BTN_BITS = {
 
 BTN_NAMES = {v: k for k, v in BTN_BITS.items()}
 
+# Button name per bit position, indexed directly by bit
+_NAMES_BY_BIT = [BTN_NAMES.get(i, f'B{i}') for i in range(20)]
+
+
+def _button_names(mask: int) -> list:
+    """Names of the buttons set in a chord mask, in bit order."""
+    names = []
+    mask &= 0xFFFFF
+    # Visit only the set bits, lowest first
+    while mask:
+        names.append(_NAMES_BY_BIT[(mask & -mask).bit_length() - 1])
+        mask &= mask - 1
+    return names
+
 # HID keycodes
 HID_NAMES = {
     0x04: 'a', 0x05: 'b', 0x06: 'c', 0x07: 'd', 0x08: 'e', 0x09: 'f',
@@ -70,57 +86,62 @@ SHIFTED = {
     '?': ('/', True),
 }
 
+# Config file layout: 128-byte header, then 8-byte entries (mask, modifier, keycode)
+HEADER_SIZE = 128
+_ENTRY_STRUCT = struct.Struct('<IHH')
+_U16_FIELD = struct.Struct('<H')
+
+# Lowercased key text -> (keycode, forced modifier flags), shifted glyphs force shift
+_KEY_TO_CODE_MOD = {name: (code, 0) for name, code in HID_CODES.items()}
+_KEY_TO_CODE_MOD.update(
+    {shifted: (HID_CODES[base], 0x20) for shifted, (base, _) in SHIFTED.items()}
+)
+
 
 class ChordEntry:
-    """Single chord mapping entry"""
+    """Single chord mapping entry (treated as immutable, derived fields precomputed)"""
+
+    __slots__ = (
+        'chord_mask', 'modifier', 'keycode',
+        'event_type', 'mod_flags',
+        'is_keyboard', 'is_mouse', 'has_shift', 'has_alt', 'has_ctrl',
+        '_chord_str', '_key_str', '_bytes',
+    )
 
     def __init__(self, chord_mask: int, modifier: int, keycode: int):
         self.chord_mask = chord_mask
         self.modifier = modifier  # Full modifier field (type in low byte, mods in high byte)
         self.keycode = keycode
 
-    @property
-    def event_type(self) -> int:
-        return self.modifier & 0xFF
-
-    @property
-    def mod_flags(self) -> int:
-        return (self.modifier >> 8) & 0xFF
+        self.event_type = modifier & 0xFF
+        self.mod_flags = (modifier >> 8) & 0xFF
+        self.is_keyboard = self.event_type == 0x02
+        self.is_mouse = self.event_type == 0x01
+        self.has_shift = bool(self.mod_flags & 0x20)
+        self.has_alt = bool(self.mod_flags & 0x04)
+        self.has_ctrl = bool(self.mod_flags & 0x02)
 
-    @property
-    def is_keyboard(self) -> bool:
-        return self.event_type == 0x02
-
-    @property
-    def is_mouse(self) -> bool:
-        return self.event_type == 0x01
-
-    @property
-    def has_shift(self) -> bool:
-        return bool(self.mod_flags & 0x20)
-
-    @property
-    def has_alt(self) -> bool:
-        return bool(self.mod_flags & 0x04)
-
-    @property
-    def has_ctrl(self) -> bool:
-        return bool(self.mod_flags & 0x02)
+        self._chord_str = None
+        self._key_str = None
+        self._bytes = None
 
     def chord_str(self) -> str:
         """Human-readable chord buttons"""
-        btns = []
-        for i in range(20):
-            if self.chord_mask & (1 << i):
-                btns.append(BTN_NAMES.get(i, f'B{i}'))
-        return '+'.join(btns) if btns else 'NONE'
+        if self._chord_str is None:
+            btns = _button_names(self.chord_mask)
+            self._chord_str = '+'.join(btns) if btns else 'NONE'
+        return self._chord_str
 
     def key_str(self) -> str:
         """Human-readable key output"""
+        if self._key_str is None:
+            self._key_str = self._format_key()
+        return self._key_str
+
+    def base_key_str(self) -> str:
+        """Key output without the C-/A-/S- modifier prefixes"""
         if not self.is_keyboard:
-            if self.is_mouse:
-                return f'Mouse({self.mod_flags:#x})'
-            return f'Event({self.event_type:#x})'
+            return self.key_str()
 
         key_name = HID_NAMES.get(self.keycode, f'0x{self.keycode:02X}')
 
@@ -133,6 +154,16 @@ class ChordEntry:
             else:
                 key_name = key_name.upper()
 
+        return key_name
+
+    def _format_key(self) -> str:
+        if not self.is_keyboard:
+            if self.is_mouse:
+                return f'Mouse({self.mod_flags:#x})'
+            return f'Event({self.event_type:#x})'
+
+        key_name = self.base_key_str()
+
         prefix = ''
         if self.has_ctrl:
             prefix += 'C-'
@@ -145,7 +176,10 @@ class ChordEntry:
 
     def to_bytes(self) -> bytes:
         """Serialize to config format"""
-        return struct.pack('<IHH', self.chord_mask, self.modifier, self.keycode)
+        # Edits replace the entry rather than mutating it, so this never goes stale
+        if self._bytes is None:
+            self._bytes = _ENTRY_STRUCT.pack(self.chord_mask, self.modifier, self.keycode)
+        return self._bytes
 
 
 class ChordConfig:
@@ -155,6 +189,12 @@ class ChordConfig:
         self.entries: List[ChordEntry] = []
         self.header: bytes = bytes(128)
         self.filepath: Optional[Path] = None
+        # Entries ordered by chord mask plus parallel mask keys, built on first use
+        # and kept in step by add_or_update/remove. File order stays in entries.
+        self._sorted: Optional[List[ChordEntry]] = None
+        self._sorted_masks: List[int] = []
+        # Bumped on every load/add_or_update/remove so views can drop derived caches
+        self.revision = 0
 
     def load(self, filepath: str) -> bool:
         """Load config from file"""
@@ -162,21 +202,19 @@ class ChordConfig:
             path = Path(filepath)
             data = path.read_bytes()
 
-            if len(data) < 128:
+            if len(data) < HEADER_SIZE:
                 return False
 
-            self.header = bytearray(data[:128])
-            chord_count = struct.unpack_from('<H', data, 8)[0]
+            self.header = bytearray(data[:HEADER_SIZE])
+            chord_count = _U16_FIELD.unpack_from(data, 8)[0]
 
-            self.entries = []
-            for i in range(chord_count):
-                off = 128 + i * 8
-                if off + 8 > len(data):
-                    break
-                mask = struct.unpack_from('<I', data, off)[0]
-                modifier = struct.unpack_from('<H', data, off + 4)[0]
-                keycode = struct.unpack_from('<H', data, off + 6)[0]
-                self.entries.append(ChordEntry(mask, modifier, keycode))
+            # Decode the whole entry block in one pass, ignoring a truncated tail
+            entry_size = _ENTRY_STRUCT.size
+            chord_count = min(chord_count, (len(data) - HEADER_SIZE) // entry_size)
+            block = memoryview(data)[HEADER_SIZE:HEADER_SIZE + chord_count * entry_size]
+            self.entries = list(starmap(ChordEntry, _ENTRY_STRUCT.iter_unpack(block)))
+            self._sorted = None
+            self.revision += 1
 
             self.filepath = path
             return True
@@ -192,13 +230,13 @@ class ChordConfig:
                 return False
 
             # Update header
-            struct.pack_into('<H', self.header, 8, len(self.entries))
-            struct.pack_into('<H', self.header, 10, 128 + len(self.entries) * 8)
+            _U16_FIELD.pack_into(self.header, 8, len(self.entries))
+            _U16_FIELD.pack_into(self.header, 10, HEADER_SIZE + len(self.entries) * 8)
 
             # Build file
-            data = bytes(self.header)
+            data = bytearray(self.header)
             for entry in self.entries:
-                data += entry.to_bytes()
+                data.extend(entry.to_bytes())
 
             path.write_bytes(data)
             self.filepath = path
@@ -214,8 +252,24 @@ class ChordConfig:
                 return entry
         return None
 
+    def sorted_entries(self) -> List[ChordEntry]:
+        """Entries ordered by chord mask"""
+        if self._sorted is None:
+            self._sorted = sorted(self.entries, key=lambda e: e.chord_mask)
+            self._sorted_masks = [e.chord_mask for e in self._sorted]
+        return self._sorted
+
     def add_or_update(self, entry: ChordEntry):
         """Add new chord or update existing"""
+        self.revision += 1
+        if self._sorted is not None:
+            idx = bisect.bisect_left(self._sorted_masks, entry.chord_mask)
+            if idx < len(self._sorted_masks) and self._sorted_masks[idx] == entry.chord_mask:
+                self._sorted[idx] = entry
+            else:
+                self._sorted_masks.insert(idx, entry.chord_mask)
+                self._sorted.insert(idx, entry)
+
         for i, e in enumerate(self.entries):
             if e.chord_mask == entry.chord_mask:
                 self.entries[i] = entry
@@ -227,6 +281,11 @@ class ChordConfig:
         for i, e in enumerate(self.entries):
             if e.chord_mask == chord_mask:
                 del self.entries[i]
+                self.revision += 1
+                if self._sorted is not None:
+                    idx = bisect.bisect_left(self._sorted_masks, chord_mask)
+                    del self._sorted_masks[idx]
+                    del self._sorted[idx]
                 return True
         return False
 
@@ -271,6 +330,14 @@ class ChordTreeNode(BoxLayout, TreeViewNode):
         self.add_widget(self.btn_label)
         self.add_widget(self.output_label)
 
+    def set_entry(self, entry):
+        """Show a different entry's output on this node"""
+        self.entry = entry
+        output = entry.key_str() if entry else ''
+        self.output_label.text = output
+        self.output_label.bold = bool(output)
+        self.output_label.color = (0.4, 0.9, 0.4, 1) if output else (0.5, 0.5, 0.5, 1)
+
     def on_touch_down(self, touch):
         if self.collide_point(*touch.pos):
             # Right-click = immediate edit
@@ -322,11 +389,17 @@ class ChordTreeView(BoxLayout):
     on_select = ObjectProperty(None)  # Callback when entry selected
     on_edit = ObjectProperty(None)    # Callback when edit requested (long-press/right-click)
 
+    # Nodes created per frame while populating, keeps the UI responsive on big configs
+    POPULATE_BATCH = 50
+
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.orientation = 'vertical'
         # Ensure this widget expands to fill available space
         self.size_hint = (1, 1)
+        self._populate_event = None
+        self._last_fingerprint = None
+        self._nodes_by_mask: Dict[int, ChordTreeNode] = {}
 
         # Scrollable tree - must also expand
         self.scroll = ScrollView(size_hint=(1, 1))
@@ -351,11 +424,29 @@ class ChordTreeView(BoxLayout):
         if self.on_edit:
             self.on_edit(entry)
 
+    def _fingerprint(self):
+        """Cheap identity of the config contents shown in the tree"""
+        if not self.config:
+            return None
+        return hash(tuple((e.chord_mask, e.modifier, e.keycode) for e in self.config.entries))
+
     def refresh(self):
         """Rebuild tree from config"""
-        # Clear existing nodes
-        for node in list(self.tree.iterate_all_nodes()):
+        # Nothing to do if the config contents haven't changed since last build
+        fingerprint = self._fingerprint()
+        if fingerprint is not None and fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+
+        # Abandon any population still in progress from a previous refresh
+        if self._populate_event:
+            self._populate_event.cancel()
+            self._populate_event = None
+
+        # Clear existing nodes - removing top-level nodes detaches their subtrees
+        for node in list(self.tree.root.nodes):
             self.tree.remove_node(node)
+        self._nodes_by_mask = {}
 
         if not self.config or not self.config.entries:
             return
@@ -369,10 +460,7 @@ class ChordTreeView(BoxLayout):
                 continue
 
             # Get buttons in this chord, sorted by bit position
-            buttons = []
-            for i in range(20):
-                if entry.chord_mask & (1 << i):
-                    buttons.append(BTN_NAMES.get(i, f'B{i}'))
+            buttons = _button_names(entry.chord_mask)
 
             if not buttons:
                 continue
@@ -390,11 +478,23 @@ class ChordTreeView(BoxLayout):
                 current[last_btn] = {'_children': {}, '_entries': []}
             current[last_btn]['_entries'].append(entry)
 
-        # Recursively add nodes to tree
-        self._add_nodes(tree_data, None)
+        # Add nodes in batches - first batch now, the rest over following frames
+        pending = self._add_nodes(tree_data, None)
+        if self._populate_batch(pending):
+            self._populate_event = Clock.schedule_interval(
+                lambda dt: self._populate_batch(pending), 0
+            )
+
+    def _populate_batch(self, pending) -> bool:
+        """Add up to POPULATE_BATCH nodes, return False once all are added"""
+        for _ in range(self.POPULATE_BATCH):
+            if next(pending, None) is None:
+                self._populate_event = None
+                return False
+        return True
 
     def _add_nodes(self, data: dict, parent):
-        """Recursively add nodes to tree"""
+        """Recursively add nodes to tree, yielding after each node"""
         # Sort buttons for consistent display
         btn_order = list(BTN_BITS.keys())
 
@@ -428,10 +528,26 @@ class ChordTreeView(BoxLayout):
                 self.tree.add_node(node, parent)
             else:
                 self.tree.add_node(node)
+            if entry:
+                self._nodes_by_mask[entry.chord_mask] = node
+            yield node
 
             # Add children recursively
             if children:
-                self._add_nodes(children, node)
+                yield from self._add_nodes(children, node)
+
+    def update_entry(self, entry: ChordEntry) -> bool:
+        """Update the node showing entry's chord in place.
+
+        Returns False if no node shows that chord yet, in which case the
+        caller should refresh() to rebuild the tree.
+        """
+        node = self._nodes_by_mask.get(entry.chord_mask)
+        if node is None or not entry.is_keyboard:
+            return False
+        node.set_entry(entry)
+        self._last_fingerprint = self._fingerprint()
+        return True
 
 
 class ChordListItem(BoxLayout):
@@ -479,17 +595,21 @@ class ChordListItem(BoxLayout):
         self.add_widget(self.key_label)
         self.add_widget(self.type_label)
 
-        self.bind(pos=self._update_bg, size=self._update_bg, selected=self._update_bg)
-        self._update_bg()
-
-    def _update_bg(self, *args):
-        self.canvas.before.clear()
+        # Background instructions are created once and updated in place
         with self.canvas.before:
-            if self.selected:
-                Color(0.3, 0.4, 0.5, 1)
-            else:
-                Color(0.18, 0.18, 0.18, 1)
-            Rectangle(pos=self.pos, size=self.size)
+            self._bg_color = Color(*self._bg_rgba(self.selected))
+            self._bg_rect = Rectangle(pos=self.pos, size=self.size)
+
+        # Each property feeds its instruction directly, no full background update
+        self.bind(
+            pos=lambda inst, value: setattr(self._bg_rect, 'pos', value),
+            size=lambda inst, value: setattr(self._bg_rect, 'size', value),
+            selected=lambda inst, value: setattr(self._bg_color, 'rgba', self._bg_rgba(value))
+        )
+
+    @staticmethod
+    def _bg_rgba(selected) -> tuple:
+        return (0.3, 0.4, 0.5, 1) if selected else (0.18, 0.18, 0.18, 1)
 
 
 class ChordListView(ScrollView):
@@ -511,24 +631,25 @@ class ChordListView(ScrollView):
         self.container.bind(minimum_height=self.container.setter('height'))
         self.add_widget(self.container)
 
-        self._items: List[ChordListItem] = []
+        # Items keyed by id() of their entry, so selection touches only two items
+        self._item_by_entry_id: Dict[int, ChordListItem] = {}
+        self._selected_item: Optional[ChordListItem] = None
 
     def refresh(self):
         """Rebuild list from config"""
         self.container.clear_widgets()
-        self._items = []
+        self._item_by_entry_id = {}
+        self._selected_item = None
 
         if not self.config:
             return
 
-        # Sort entries by chord mask for consistent display
-        sorted_entries = sorted(self.config.entries, key=lambda e: e.chord_mask)
-
-        for entry in sorted_entries:
+        # Entries ordered by chord mask for consistent display
+        for entry in self.config.sorted_entries():
             item = ChordListItem(entry)
             item.bind(on_touch_down=self._on_item_touch)
             self.container.add_widget(item)
-            self._items.append(item)
+            self._item_by_entry_id[id(entry)] = item
 
     def _on_item_touch(self, item, touch):
         if item.collide_point(*touch.pos):
@@ -539,8 +660,14 @@ class ChordListView(ScrollView):
     def select(self, entry: Optional[ChordEntry]):
         """Select an entry"""
         self.selected_entry = entry
-        for item in self._items:
-            item.selected = (item.entry == entry)
+        new_item = self._item_by_entry_id.get(id(entry)) if entry else None
+        if new_item is self._selected_item:
+            return
+        if self._selected_item:
+            self._selected_item.selected = False
+        if new_item:
+            new_item.selected = True
+        self._selected_item = new_item
 
 
 class ButtonSelector(GridLayout):
@@ -557,6 +684,7 @@ class ButtonSelector(GridLayout):
         self.height = 200
 
         self._buttons: Dict[str, ToggleButton] = {}
+        self._buttons_by_bit: Dict[int, ToggleButton] = {}
 
         # Create button grid in layout order
         button_layout = [
@@ -575,24 +703,30 @@ class ButtonSelector(GridLayout):
                     height=35
                 )
                 btn.btn_name = btn_name
+                btn.bit = BTN_BITS[btn_name]
                 btn.bind(state=self._on_button_toggle)
                 self.add_widget(btn)
                 self._buttons[btn_name] = btn
+                self._buttons_by_bit[btn.bit] = btn
 
     def _on_button_toggle(self, instance, state):
-        # Recalculate mask
-        mask = 0
-        for name, btn in self._buttons.items():
-            if btn.state == 'down':
-                mask |= (1 << BTN_BITS[name])
-        self.selected_mask = mask
+        # Only the toggled button's bit changes
+        if state == 'down':
+            self.selected_mask |= (1 << instance.bit)
+        else:
+            self.selected_mask &= ~(1 << instance.bit)
 
     def set_mask(self, mask: int):
         """Set buttons from mask"""
+        diff = mask ^ self.selected_mask
         self.selected_mask = mask
-        for name, btn in self._buttons.items():
-            bit = BTN_BITS[name]
-            btn.state = 'down' if (mask & (1 << bit)) else 'normal'
+        # Walk only the bits that differ, lowest first
+        while diff:
+            bit = (diff & -diff).bit_length() - 1
+            diff &= diff - 1
+            btn = self._buttons_by_bit.get(bit)
+            if btn:
+                btn.state = 'down' if (mask >> bit) & 1 else 'normal'
 
 
 class ChordEditor(BoxLayout):
@@ -606,6 +740,7 @@ class ChordEditor(BoxLayout):
         self.orientation = 'vertical'
         self.padding = 10
         self.spacing = 10
+        self._preview_scheduled = None
 
         # Title
         self.title = Label(
@@ -671,7 +806,7 @@ class ChordEditor(BoxLayout):
         self.entry = entry
         if entry:
             self.btn_selector.set_mask(entry.chord_mask)
-            self.key_input.text = entry.key_str().lstrip('C-A-S-')
+            self.key_input.text = entry.base_key_str()
             self.shift_btn.state = 'down' if entry.has_shift else 'normal'
             self.alt_btn.state = 'down' if entry.has_alt else 'normal'
             self.ctrl_btn.state = 'down' if entry.has_ctrl else 'normal'
@@ -686,6 +821,13 @@ class ChordEditor(BoxLayout):
         self._update_preview()
 
     def _update_preview(self, *args):
+        """Schedule a preview update, collapsing bursts of changes into one per frame"""
+        if self._preview_scheduled:
+            return
+        self._preview_scheduled = Clock.schedule_once(self._do_update_preview, 0)
+
+    def _do_update_preview(self, dt):
+        self._preview_scheduled = None
         chord = self._chord_str()
         key = self.key_input.text
         mods = ''
@@ -698,11 +840,7 @@ class ChordEditor(BoxLayout):
         self.preview.text = f'{chord} -> {mods}{key}'
 
     def _chord_str(self) -> str:
-        mask = self.btn_selector.selected_mask
-        btns = []
-        for i in range(20):
-            if mask & (1 << i):
-                btns.append(BTN_NAMES.get(i, f'B{i}'))
+        btns = _button_names(self.btn_selector.selected_mask)
         return '+'.join(btns) if btns else '(none)'
 
     def _build_entry(self) -> Optional[ChordEntry]:
@@ -715,20 +853,14 @@ class ChordEditor(BoxLayout):
         if not key_text:
             return None
 
-        # Look up keycode
-        keycode = HID_CODES.get(key_text)
-        if keycode is None:
-            # Check shifted
-            if key_text in SHIFTED:
-                base, _ = SHIFTED[key_text]
-                keycode = HID_CODES.get(base)
-                # Shift will be forced on
-            if keycode is None:
-                return None
+        # Look up keycode (shifted characters force shift on)
+        code_mod = _KEY_TO_CODE_MOD.get(key_text)
+        if code_mod is None:
+            return None
+        keycode, mod_flags = code_mod
 
         # Build modifier field
-        mod_flags = 0
-        if self.shift_btn.state == 'down' or key_text in SHIFTED:
+        if self.shift_btn.state == 'down':
             mod_flags |= 0x20
         if self.alt_btn.state == 'down':
             mod_flags |= 0x04
@@ -776,7 +908,7 @@ class ChordEditPopup(Popup):
         key_row = BoxLayout(size_hint_y=None, height=40, spacing=10)
         key_row.add_widget(Label(text='Key:', size_hint_x=0.3))
         self.key_input = TextInput(
-            text=entry.key_str().lstrip('C-A-S-'),
+            text=entry.base_key_str(),
             multiline=False,
             size_hint_x=0.7
         )
@@ -814,19 +946,14 @@ class ChordEditPopup(Popup):
         if not key_text:
             return
 
-        # Look up keycode
-        keycode = HID_CODES.get(key_text)
-        if keycode is None:
-            # Check shifted
-            if key_text in SHIFTED:
-                base, _ = SHIFTED[key_text]
-                keycode = HID_CODES.get(base)
-            if keycode is None:
-                return
+        # Look up keycode (shifted characters force shift on)
+        code_mod = _KEY_TO_CODE_MOD.get(key_text)
+        if code_mod is None:
+            return
+        keycode, mod_flags = code_mod
 
         # Build modifier field
-        mod_flags = 0
-        if self.shift_btn.state == 'down' or key_text in SHIFTED:
+        if self.shift_btn.state == 'down':
             mod_flags |= 0x20
         if self.alt_btn.state == 'down':
             mod_flags |= 0x04
@@ -928,7 +1055,8 @@ class ChordMapView(BoxLayout):
     def _on_edit_save(self, entry: ChordEntry):
         """Save edited chord"""
         self._config.add_or_update(entry)
-        self.chord_tree.refresh()
+        if not self.chord_tree.update_entry(entry):
+            self.chord_tree.refresh()
         self.status_label.text = 'Chord updated'
 
     def _on_edit_delete(self, entry: ChordEntry):
@@ -942,16 +1070,24 @@ class ChordMapView(BoxLayout):
         content = BoxLayout(orientation='vertical')
 
         start_path = str(Path.cwd() / 'configs') if (Path.cwd() / 'configs').exists() else str(Path.home())
-        chooser = FileChooserListView(
-            path=start_path,
-            filters=['*.cfg']
-        )
-        content.add_widget(chooser)
+        # Placeholder until the chooser (which scans start_path) is built next frame
+        placeholder = Label(text='Loading...')
+        content.add_widget(placeholder)
+        chooser = None
+
+        def build_chooser(dt):
+            nonlocal chooser
+            chooser = FileChooserListView(
+                path=start_path,
+                filters=['*.cfg']
+            )
+            content.remove_widget(placeholder)
+            content.add_widget(chooser, index=len(content.children))
 
         btn_row = BoxLayout(size_hint_y=None, height=50, spacing=10)
 
         def do_load(btn):
-            if chooser.selection:
+            if chooser and chooser.selection:
                 self.load_config(chooser.selection[0])
             popup.dismiss()
 
@@ -973,6 +1109,7 @@ class ChordMapView(BoxLayout):
             size_hint=(0.9, 0.9)
         )
         popup.open()
+        Clock.schedule_once(build_chooser, 0)
 
     def load_config(self, filepath: str):
         """Load config file"""
@@ -998,12 +1135,11 @@ class ChordMapView(BoxLayout):
         self.status_label.text = 'Uploading...'
 
         # Build config bytes on main thread (fast)
-        header = bytearray(self._config.header)
-        struct.pack_into('<H', header, 8, len(self._config.entries))
-
-        data = bytes(header)
+        buf = bytearray(self._config.header)
+        _U16_FIELD.pack_into(buf, 8, len(self._config.entries))
         for entry in self._config.entries:
-            data += entry.to_bytes()
+            buf.extend(entry.to_bytes())
+        data = bytes(buf)
 
         # Delegate to app's upload callback if available (manages stream stop/restart)
         if self._on_upload_callback:
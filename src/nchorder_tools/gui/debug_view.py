@@ -8,15 +8,20 @@ Shows:
 - Raw RTT log output
 """
 
+from collections import deque
+
 from kivy.app import App
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
-from kivy.uix.scrollview import ScrollView
+from kivy.uix.recycleview import RecycleView
+from kivy.uix.recycleboxlayout import RecycleBoxLayout
 from kivy.uix.widget import Widget
-from kivy.graphics import Color, Ellipse, Rectangle, Line
-from kivy.clock import Clock, mainthread
+from kivy.graphics import Color, Ellipse, Rectangle, Line, InstructionGroup
+from kivy.graphics.texture import Texture
+from kivy.core.text import Label as CoreLabel
+from kivy.clock import Clock
 from kivy.properties import (
     NumericProperty, BooleanProperty, ListProperty,
     StringProperty, ObjectProperty
@@ -28,6 +33,14 @@ from ..rtt_reader import RTTReader, TrillSensorData, GestureEvent, ButtonEvent,
 class SensorSquareWidget(Widget):
     """Visualize the Trill Square (2D) sensor"""
 
+    # Quadrant labels as (x fraction, y fraction, text)
+    QUADRANTS = [
+        (0.25, 0.75, "T1"),
+        (0.75, 0.75, "T2"),
+        (0.25, 0.25, "T3"),
+        (0.75, 0.25, "T4"),
+    ]
+
     touch_x = NumericProperty(0)
     touch_y = NumericProperty(0)
     touch_size = NumericProperty(0)
@@ -35,63 +48,98 @@ class SensorSquareWidget(Widget):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.bind(pos=self._redraw, size=self._redraw,
-                  touch_x=self._redraw, touch_y=self._redraw,
-                  touch_size=self._redraw)
-        self._redraw()
-
-    def _redraw(self, *args):
-        self.canvas.clear()
+        # Static parts, only moved/resized on layout changes
         with self.canvas:
             # Background
             Color(0.12, 0.12, 0.15)
-            Rectangle(pos=self.pos, size=self.size)
+            self._bg = Rectangle(pos=self.pos, size=self.size)
 
             # Grid
             Color(0.2, 0.2, 0.25)
-            cx, cy = self.center
-            # Vertical center line
-            Line(points=[cx, self.y, cx, self.top], width=1)
-            # Horizontal center line
-            Line(points=[self.x, cy, self.right, cy], width=1)
+            self._v_line = Line(width=1)  # Vertical center line
+            self._h_line = Line(width=1)  # Horizontal center line
 
-            # Quadrant labels
+            # Quadrant labels, rendered to textures once
             Color(0.3, 0.3, 0.35)
-            q_size = 20
-            for i, (qx, qy, label) in enumerate([
-                (0.25, 0.75, "T1"),
-                (0.75, 0.75, "T2"),
-                (0.25, 0.25, "T3"),
-                (0.75, 0.25, "T4"),
-            ]):
-                x = self.x + self.width * qx
-                y = self.y + self.height * qy
+            self._quad_rects = []
+            for _, _, text in self.QUADRANTS:
+                label = CoreLabel(text=text, font_size=14)
+                label.refresh()
+                self._quad_rects.append(
+                    Rectangle(texture=label.texture, size=label.texture.size))
 
             # Border
             Color(0.4, 0.4, 0.5)
-            Line(rectangle=(*self.pos, *self.size), width=2)
+            self._border = Line(width=2)
+
+        # Touch point, added to the canvas only while touched
+        self._touch_group = InstructionGroup()
+        # Glow
+        self._touch_group.add(Color(0.2, 0.8, 0.3, 0.3))
+        self._glow = Ellipse()
+        self._touch_group.add(self._glow)
+        # Main point
+        self._touch_group.add(Color(0.2, 0.9, 0.3))
+        self._main = Ellipse()
+        self._touch_group.add(self._main)
+        # Center dot
+        self._touch_group.add(Color(1, 1, 1))
+        self._dot = Ellipse(size=(6, 6))
+        self._touch_group.add(self._dot)
+        self._touch_visible = False
+
+        # Coalesce pos/size changes from one layout pass into a single resize
+        self._resize_trigger = Clock.create_trigger(self._resize, 0)
+        self.bind(pos=self._resize_trigger, size=self._resize_trigger)
+        # x, y and size are set together each tick; move the touch point once
+        self._touch_trigger = Clock.create_trigger(self._update_touch, 0)
+        self.bind(touch_x=self._touch_trigger, touch_y=self._touch_trigger,
+                  touch_size=self._touch_trigger)
+        self._resize_trigger()
+
+    def _resize(self, *args):
+        if self.width <= 0 or self.height <= 0:
+            return
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+
+        cx, cy = self.center
+        self._v_line.points = [cx, self.y, cx, self.top]
+        self._h_line.points = [self.x, cy, self.right, cy]
 
-            # Touch point
-            if self.touch_size > 0:
-                px = self.x + (self.touch_x / self.max_coord) * self.width
-                py = self.y + (self.touch_y / self.max_coord) * self.height
+        # Quadrant labels, centered on each quadrant
+        for rect, (qx, qy, _) in zip(self._quad_rects, self.QUADRANTS):
+            w, h = rect.size
+            rect.pos = (self.x + self.width * qx - w / 2,
+                        self.y + self.height * qy - h / 2)
 
-                radius = 8 + (self.touch_size / 150)
-                radius = min(radius, 30)
+        self._border.rectangle = (*self.pos, *self.size)
 
-                # Glow
-                Color(0.2, 0.8, 0.3, 0.3)
-                Ellipse(pos=(px - radius*1.5, py - radius*1.5),
-                        size=(radius*3, radius*3))
+        # Touch point position is relative to the widget bounds
+        self._update_touch()
 
-                # Main point
-                Color(0.2, 0.9, 0.3)
-                Ellipse(pos=(px - radius, py - radius),
-                        size=(radius*2, radius*2))
+    def _update_touch(self, *args):
+        if self.touch_size <= 0:
+            if self._touch_visible:
+                self.canvas.remove(self._touch_group)
+                self._touch_visible = False
+            return
+
+        px = self.x + (self.touch_x / self.max_coord) * self.width
+        py = self.y + (self.touch_y / self.max_coord) * self.height
+
+        radius = 8 + (self.touch_size / 150)
+        radius = min(radius, 30)
 
-                # Center dot
-                Color(1, 1, 1)
-                Ellipse(pos=(px - 3, py - 3), size=(6, 6))
+        self._glow.pos = (px - radius*1.5, py - radius*1.5)
+        self._glow.size = (radius*3, radius*3)
+        self._main.pos = (px - radius, py - radius)
+        self._main.size = (radius*2, radius*2)
+        self._dot.pos = (px - 3, py - 3)
+
+        if not self._touch_visible:
+            self.canvas.add(self._touch_group)
+            self._touch_visible = True
 
 
 class SensorBarWidget(Widget):
@@ -111,42 +159,73 @@ class SensorBarWidget(Widget):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.bind(pos=self._redraw, size=self._redraw,
-                  touch_pos=self._redraw, touch_size=self._redraw)
-        self._redraw()
-
-    def _redraw(self, *args):
-        self.canvas.clear()
+        # Static parts, only moved/resized on layout changes
         with self.canvas:
             # Background
             Color(0.12, 0.12, 0.15)
-            Rectangle(pos=self.pos, size=self.size)
+            self._bg = Rectangle(pos=self.pos, size=self.size)
 
             # Zone dividers (4 zones)
             Color(0.25, 0.25, 0.3)
-            for i in range(1, 4):
-                y = self.y + (self.height * i / 4)
-                Line(points=[self.x, y, self.right, y], width=1)
+            self._dividers = [Line(width=1) for _ in range(3)]
 
             # Border
             Color(0.4, 0.4, 0.5)
-            Line(rectangle=(*self.pos, *self.size), width=2)
-
-            # Touch indicator - only show if size exceeds threshold
-            if self.touch_size >= self.min_touch_size:
-                py = self.y + (self.touch_pos / self.max_pos) * self.height
-
-                bar_h = 4 + (self.touch_size / 80)
-                bar_h = min(bar_h, 15)
-
-                # Brightness based on touch size (0.4 to 1.0)
-                brightness = min(1.0, 0.4 + (self.touch_size / 2000))
-                color = self.BAR_COLORS[self.bar_index % 3]
-                Color(color[0] * brightness, color[1] * brightness, color[2] * brightness)
-                Rectangle(
-                    pos=(self.x + 4, py - bar_h/2),
-                    size=(self.width - 8, bar_h)
-                )
+            self._border = Line(width=2)
+
+        # Touch indicator, added to the canvas only while above the threshold
+        self._touch_group = InstructionGroup()
+        self._touch_color = Color(0, 0, 0)
+        self._touch_group.add(self._touch_color)
+        self._touch_rect = Rectangle()
+        self._touch_group.add(self._touch_rect)
+        self._touch_visible = False
+
+        # Coalesce pos/size changes from one layout pass into a single resize
+        self._resize_trigger = Clock.create_trigger(self._resize, 0)
+        self.bind(pos=self._resize_trigger, size=self._resize_trigger)
+        self._touch_trigger = Clock.create_trigger(self._update_touch, 0)
+        self.bind(touch_pos=self._touch_trigger, touch_size=self._touch_trigger)
+        self._resize_trigger()
+
+    def _resize(self, *args):
+        if self.width <= 0 or self.height <= 0:
+            return
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+
+        for i, line in enumerate(self._dividers, start=1):
+            y = self.y + (self.height * i / 4)
+            line.points = [self.x, y, self.right, y]
+
+        self._border.rectangle = (*self.pos, *self.size)
+
+        # Touch indicator position is relative to the widget bounds
+        self._update_touch()
+
+    def _update_touch(self, *args):
+        # Touch indicator - only show if size exceeds threshold
+        if self.touch_size < self.min_touch_size:
+            if self._touch_visible:
+                self.canvas.remove(self._touch_group)
+                self._touch_visible = False
+            return
+
+        py = self.y + (self.touch_pos / self.max_pos) * self.height
+
+        bar_h = 4 + (self.touch_size / 80)
+        bar_h = min(bar_h, 15)
+
+        # Brightness based on touch size (0.4 to 1.0)
+        brightness = min(1.0, 0.4 + (self.touch_size / 2000))
+        color = self.BAR_COLORS[self.bar_index % 3]
+        self._touch_color.rgb = (color[0] * brightness, color[1] * brightness, color[2] * brightness)
+        self._touch_rect.pos = (self.x + 4, py - bar_h/2)
+        self._touch_rect.size = (self.width - 8, bar_h)
+
+        if not self._touch_visible:
+            self.canvas.add(self._touch_group)
+            self._touch_visible = True
 
 
 class ButtonGridWidget(Widget):
@@ -161,69 +240,107 @@ class ButtonGridWidget(Widget):
         "T4", "F4L", "F4M", "F4R"
     ]
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.bind(pos=self._redraw, size=self._redraw, buttons=self._redraw)
-        self._redraw()
-
-    def _redraw(self, *args):
-        self.canvas.clear()
+    COLOR_ON = (0.2, 0.9, 0.2)
+    COLOR_OFF = (0.15, 0.2, 0.15)
 
-        cols = 4
-        rows = 4
-        cell_w = self.width / cols
-        cell_h = self.height / rows
+    # Grid texture: each cell is a CELL_TEXELS square with a transparent
+    # 1-texel border, which leaves a gap between neighbouring cells
+    CELL_TEXELS = 16
 
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # Precompute one texel row of a cell for each state (off, on)
+        clear = b'\x00\x00\x00\x00'
+        inner = self.CELL_TEXELS - 2
+        pixels = [bytes(round(c * 255) for c in color) + b'\xff'
+                  for color in (self.COLOR_OFF, self.COLOR_ON)]
+        self._cell_rows = [clear + px * inner + clear for px in pixels]
+        self._blank_row = clear * (self.CELL_TEXELS * 4)
+
+        # Whole grid is one textured quad, updated by a single blit
+        size = self.CELL_TEXELS * 4
+        self._tex = Texture.create(size=(size, size), colorfmt='rgba')
+        self._tex.mag_filter = 'nearest'
+        self._tex.min_filter = 'nearest'
         with self.canvas:
-            for i in range(16):
-                row = i // cols
-                col = i % cols
+            Color(1, 1, 1)
+            self._rect = Rectangle(texture=self._tex)
+        self._shown_buttons = None
+
+        # Coalesce pos/size changes from one layout pass into a single relayout
+        self._layout_trigger = Clock.create_trigger(self._layout, 0)
+        self.bind(pos=self._layout_trigger, size=self._layout_trigger,
+                  buttons=self._update_buttons)
+        self._layout_trigger()
+        self._update_buttons()
+
+    def _layout(self, *args):
+        if self.width <= 0 or self.height <= 0:
+            return
+        self._rect.pos = self.pos
+        self._rect.size = self.size
 
-                x = self.x + col * cell_w
-                y = self.top - (row + 1) * cell_h
+    def _update_buttons(self, *args):
+        buttons = int(self.buttons) & 0xFFFF
+        if buttons == self._shown_buttons:
+            return
+        self._shown_buttons = buttons
 
-                is_on = (self.buttons >> i) & 1
+        cell_rows = self._cell_rows
+        blank = self._blank_row
+        inner = self.CELL_TEXELS - 2
+        blocks = []
+        # Texture rows run bottom-up, grid rows (T1.. first) top-down
+        for row in (3, 2, 1, 0):
+            bits = buttons >> (row * 4)
+            line = b''.join([cell_rows[(bits >> col) & 1] for col in range(4)])
+            blocks.append(blank + line * inner + blank)
+        self._tex.blit_buffer(b''.join(blocks), colorfmt='rgba', bufferfmt='ubyte')
 
-                # Background
-                if is_on:
-                    Color(0.2, 0.9, 0.2)
-                else:
-                    Color(0.15, 0.2, 0.15)
 
-                margin = 3
-                Rectangle(
-                    pos=(x + margin, y + margin),
-                    size=(cell_w - margin*2, cell_h - margin*2)
-                )
+class EventLogLine(Label):
+    """One event log row, reused by EventLogWidget's RecycleView"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.halign = 'left'
+        self.valign = 'middle'
+        self.font_size = '12sp'
+        self.bind(size=self.setter('text_size'))
 
 
-class EventLogWidget(ScrollView):
+class EventLogWidget(RecycleView):
     """Scrolling log of events"""
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.layout = BoxLayout(orientation='vertical', size_hint_y=None)
-        self.layout.bind(minimum_height=self.layout.setter('height'))
-        self.add_widget(self.layout)
         self._max_lines = 50
+        self._lines = deque(maxlen=self._max_lines)  # Row data dicts, oldest dropped
+        self._dirty = False
 
-    def add_line(self, text: str, color=(0.8, 0.8, 0.8, 1)):
-        label = Label(
-            text=text,
+        # Only the rows in view get a Label, recycled as the log scrolls
+        self.viewclass = EventLogLine
+        layout = RecycleBoxLayout(
+            orientation='vertical',
             size_hint_y=None,
-            height=22,
-            halign='left',
-            valign='middle',
-            color=color,
-            font_size='12sp'
+            default_size=(None, 20),
+            default_size_hint=(1, None)
         )
-        label.bind(size=label.setter('text_size'))
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+
+        Clock.schedule_interval(self._flush, 1/10)
 
-        self.layout.add_widget(label)
+    def add_line(self, text: str, color=(0.8, 0.8, 0.8, 1)):
+        self._lines.append({'text': text, 'color': color})
+        self._dirty = True
 
-        # Limit lines
-        while len(self.layout.children) > self._max_lines:
-            self.layout.remove_widget(self.layout.children[-1])
+    def _flush(self, dt):
+        """Push buffered lines to the view if any were added since the last flush."""
+        if not self._dirty:
+            return
+        self._dirty = False
+        self.data = list(self._lines)
 
         # Scroll to bottom
         self.scroll_y = 0
@@ -238,14 +355,17 @@ class DebugPanel(BoxLayout):
         self.padding = 10
         self.spacing = 10
 
-        # RTT Reader
+        # RTT Reader - event callbacks run on its thread, so they only queue
+        # (handler, event) pairs; deque append/popleft are thread-safe
+        self._pending_events = deque()
         self.rtt = RTTReader()
         self.rtt.on_sensor_data = self._on_sensor
-        self.rtt.on_gesture = self._on_gesture
-        self.rtt.on_button = self._on_button
-        self.rtt.on_raw2d = self._on_raw2d
+        self.rtt.on_gesture = lambda e: self._pending_events.append((self._on_gesture, e))
+        self.rtt.on_button = lambda e: self._pending_events.append((self._on_button, e))
+        self.rtt.on_raw2d = lambda e: self._pending_events.append((self._on_raw2d, e))
 
-        # Left panel: sensors
+        # Left panel: sensors. No panel background - each sensor widget paints
+        # an opaque rect over its own bounds, so one would only be overdrawn
         left = BoxLayout(orientation='vertical', size_hint_x=0.5, spacing=5)
 
         # Square sensor
@@ -325,8 +445,12 @@ class DebugPanel(BoxLayout):
 
         self.add_widget(right)
 
-        # Start update timer
-        Clock.schedule_interval(self._update, 1/30)
+        # Start update timers - sensor widgets at 30Hz, text labels at 5Hz
+        self._last_sensor_sig = None
+        self._last_gesture_key = None
+        Clock.schedule_interval(self._update_canvas, 1/30)
+        Clock.schedule_interval(self._update_labels, 1/5)
+        Clock.schedule_interval(self._drain_events, 1/30)
 
     def _toggle_connection(self, *args):
         if self.rtt._running:
@@ -348,9 +472,15 @@ class DebugPanel(BoxLayout):
         """Handle sensor data update."""
         pass  # Handled in _update via polling
 
-    @mainthread
+    def _drain_events(self, dt):
+        """Handle all events queued by the RTT thread since the last tick."""
+        pending = self._pending_events
+        while pending:
+            handler, event = pending.popleft()
+            handler(event)
+
     def _on_gesture(self, event: GestureEvent):
-        """Handle gesture event (called from background thread, runs on main)."""
+        """Handle gesture event (queued from background thread, runs on main)."""
         if event.event_type == "tap":
             self.event_log.add_line(
                 f"TAP Q{event.quadrant} @ ({event.x},{event.y}) {event.frames}f",
@@ -372,92 +502,100 @@ class DebugPanel(BoxLayout):
                 (0.7, 0.7, 0.7, 1)
             )
 
-    @mainthread
     def _on_button(self, event: ButtonEvent):
-        """Handle button state change (called from background thread, runs on main)."""
+        """Handle button state change (queued from background thread, runs on main)."""
         self.event_log.add_line(
             f"BUTTONS 0x{event.raw_mask:04X} = {event.button_names}",
             (1, 1, 0.3, 1)
         )
 
-    @mainthread
     def _on_raw2d(self, event: Raw2DEvent):
-        """Handle RAW2D debug output (called from background thread, runs on main)."""
-        # Parse hex bytes to readable values
-        def parse_positions(hex_str):
-            """Parse 10 hex bytes (5 x 16-bit BE values) to list of ints."""
-            vals = []
-            for i in range(0, len(hex_str), 4):
-                if i + 4 <= len(hex_str):
-                    val = int(hex_str[i:i+4], 16)
-                    if val != 0xFFFF:
-                        vals.append(val)
-            return vals
-
-        y_vals = parse_positions(event.y_bytes)
-        x_vals = parse_positions(event.x_bytes)
-        s_vals = parse_positions(event.size_bytes)
-
+        """Handle RAW2D debug output (queued from background thread, runs on main)."""
+        # Values were already decoded on the reader thread
         self.event_log.add_line(
-            f"RAW2D Y={y_vals} X={x_vals} S={s_vals}",
+            f"RAW2D Y={event.y_vals} X={event.x_vals} S={event.s_vals}",
             (0.7, 0.7, 1, 1)
         )
 
-    def _update(self, dt):
-        """Update display from latest sensor data."""
-        if not self.rtt._running:
+    def _update_canvas(self, dt):
+        """Update sensor widgets from latest sensor data."""
+        rtt = self.rtt
+        if not rtt._running:
+            return
+
+        sensors = rtt.sensors
+        sq = sensors[0]
+        sq_touches = sq.touches_2d
+        sq_touch = sq_touches[0] if sq.is_2d and sq_touches else None
+        bar_touches = [s.touches_1d[0] if s.touches_1d else None for s in sensors[1:4]]
+        buttons = rtt.last_buttons.raw_mask
+
+        # Skip the frame entirely if nothing shown has changed
+        sig = (
+            (sq_touch.x, sq_touch.y, sq_touch.size) if sq_touch else None,
+            tuple((t.position, t.size) if t else None for t in bar_touches),
+            buttons,
+        )
+        if sig == self._last_sensor_sig:
             return
+        self._last_sensor_sig = sig
 
         # Update Square sensor
-        sq = self.rtt.sensors[0]
-        if sq.is_2d and sq.touches_2d:
-            t = sq.touches_2d[0]
-            self.square.touch_x = t.x
-            self.square.touch_y = t.y
-            self.square.touch_size = t.size
+        square = self.square
+        if sq_touch:
+            square.touch_x = sq_touch.x
+            square.touch_y = sq_touch.y
+            square.touch_size = sq_touch.size
         else:
-            self.square.touch_size = 0
+            square.touch_size = 0
 
         # Update Bar sensors
-        for i, bar in enumerate(self.bars):
-            s = self.rtt.sensors[i + 1]
-            if s.touches_1d:
-                t = s.touches_1d[0]
+        for bar, t in zip(self.bars, bar_touches):
+            if t:
                 bar.touch_pos = t.position
                 bar.touch_size = t.size
             else:
                 bar.touch_size = 0
 
         # Update button grid
-        self.button_grid.buttons = self.rtt.last_buttons.raw_mask
+        self.button_grid.buttons = buttons
+
+    def _update_labels(self, dt):
+        """Update gesture and raw value text from latest sensor data."""
+        rtt = self.rtt
+        if not rtt._running:
+            return
 
         # Update gesture label
-        g = self.rtt.last_gesture
+        g = rtt.last_gesture
         if g:
-            self.gesture_label.text = (
-                f"Type: {g.event_type}\n"
-                f"Pos: ({g.x}, {g.y})\n"
-                f"Q: {g.quadrant}  Dist: {g.distance}  Frames: {g.frames}"
-            )
+            key = (g.event_type, g.x, g.y, g.quadrant, g.distance, g.frames)
+            if key != self._last_gesture_key:
+                self._last_gesture_key = key
+                self.gesture_label.text = (
+                    f"Type: {g.event_type}\n"
+                    f"Pos: ({g.x}, {g.y})\n"
+                    f"Q: {g.quadrant}  Dist: {g.distance}  Frames: {g.frames}"
+                )
 
         # Update raw values
-        sq = self.rtt.sensors[0]
-        if sq.touches_2d:
-            t = sq.touches_2d[0]
-            sq_text = f"Square: ({t.x}, {t.y}) size={t.size}"
+        sensors = rtt.sensors
+        sq_touches = sensors[0].touches_2d
+        if sq_touches:
+            t = sq_touches[0]
+            lines = [f"Square: ({t.x}, {t.y}) size={t.size}"]
         else:
-            sq_text = "Square: no touch"
-
-        bar_texts = []
-        for i in range(3):
-            s = self.rtt.sensors[i + 1]
-            if s.touches_1d:
-                t = s.touches_1d[0]
-                bar_texts.append(f"Bar{i}: pos={t.position} size={t.size}")
+            lines = ["Square: no touch"]
+
+        for i, s in enumerate(sensors[1:4]):
+            touches = s.touches_1d
+            if touches:
+                t = touches[0]
+                lines.append(f"Bar{i}: pos={t.position} size={t.size}")
             else:
-                bar_texts.append(f"Bar{i}: no touch")
+                lines.append(f"Bar{i}: no touch")
 
-        self.raw_label.text = sq_text + "\n" + "\n".join(bar_texts)
+        self.raw_label.text = "\n".join(lines)
 
 
 class DebugApp(App):
@@ -8,18 +8,24 @@ Typing tutor for chord keyboards that:
 - Tracks timing, WPM, and accuracy
 """
 
+import functools
+import math
 import random
 import time
+from array import array
+from collections import deque
+from operator import eq
 
-from nchorder_tools.wordlist import WORD_LIST
+from nchorder_tools.wordlist import letter_mask, words_for_letters
 
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.label import Label
 from kivy.uix.button import Button
 from kivy.uix.spinner import Spinner
+from kivy.uix.togglebutton import ToggleButton
 from kivy.uix.widget import Widget
 from kivy.uix.popup import Popup
-from kivy.graphics import Color, Rectangle, Line, RoundedRectangle
+from kivy.graphics import Color, InstructionGroup, Line, Mesh, Rectangle
 from kivy.properties import ObjectProperty, StringProperty, NumericProperty, BooleanProperty
 from kivy.clock import Clock
 from kivy.core.text import Label as CoreLabel
@@ -39,6 +45,29 @@ ROW_BITS = {
     'F0': [16, 17, 18],   # F0L, F0M, F0R
 }
 
+# Chord bits belonging to each finger row / thumb
+ROW_MASKS = {name: sum(1 << bit for bit in bits) for name, bits in ROW_BITS.items()}
+ROW_MASKS.update({name: 1 << bit for name, bit in THUMB_BITS.items()})
+
+# One flag bit per row / thumb, for the row set a chord touches
+ROW_FLAGS = {name: 1 << i for i, name in enumerate(ROW_MASKS)}
+
+
+def _row_flag_table(shift: int) -> array:
+    """ROW_FLAGS bits touched by each 10-bit chord slice starting at bit `shift`."""
+    table = array('H', bytes(2 << 10))
+    for part in range(1 << 10):
+        bits = part << shift
+        for name, mask in ROW_MASKS.items():
+            if bits & mask:
+                table[part] |= ROW_FLAGS[name]
+    return table
+
+
+# Chord masks are 20 bits; two 1024-entry tables cover them (rows may straddle the split)
+_ROW_FLAGS_LO = _row_flag_table(0)
+_ROW_FLAGS_HI = _row_flag_table(10)
+
 # Button bit positions for chord hint rendering
 BTN_BITS = {
     'T1': 0, 'F1L': 1, 'F1M': 2, 'F1R': 3,
@@ -49,6 +78,9 @@ BTN_BITS = {
     # T0 (bit 19) intentionally excluded - only used for mouse click
 }
 
+# Button bits by (row, column), e.g. ('F1', 'L') -> 1; thumbs have no column
+_ROW_COL_BITS = {(name[:2], name[2:]): bit for name, bit in BTN_BITS.items()}
+
 # QWERTY keyboard -> chord button mapping for practice without hardware
 # Layout mirrors the Twiddler grid onto a standard keyboard:
 #   Number row:  1=T1  2=T2  3=T3  4=T4  5=T0
@@ -114,6 +146,8 @@ NUMPAD_TO_BTN = {
 
 # Combined mapping: both QWERTY and numpad active
 KB_TO_BTN = {**QWERTY_TO_BTN, **NUMPAD_TO_BTN}
+# Same mapping as chord bitmasks, so key events need a single lookup
+KB_TO_MASK = {key: 1 << bit for key, bit in KB_TO_BTN.items()}
 
 # Reverse map for display: bit -> key label
 BTN_TO_KEY_LABEL = {v: k for k, v in {
@@ -154,6 +188,80 @@ HINT_LAYOUT = [
     ['F4L', 'F4M', 'F4R'],         # F4 row
 ]
 
+# Hexagon corners on the unit circle, rotated for a flat top
+_HEX_UNIT = tuple(
+    (math.cos(math.pi / 6 + i * math.pi / 3), math.sin(math.pi / 6 + i * math.pi / 3))
+    for i in range(6)
+)
+# Corner offset that moves each hexagon edge by one unit (miter length)
+_HEX_MITER = 1 / math.cos(math.pi / 6)
+
+# Circle approximated as a regular polygon
+_CIRCLE_UNIT = tuple(
+    (math.cos(i * math.pi / 12), math.sin(i * math.pi / 12)) for i in range(24)
+)
+# Circle highlight arc, 45-135 degrees clockwise from 12 o'clock as Line(circle=...)
+_ARC_UNIT = tuple(
+    (math.sin(math.radians(a)), math.cos(math.radians(a))) for a in range(45, 136, 15)
+)
+# Rounded rectangle outline as (corner x side, corner y side, normal x, normal y),
+# four 90-degree arcs counter-clockwise from the top-right corner
+_ROUND_CORNERS = tuple(
+    (sx, sy, math.cos(math.radians(q * 90 + j * 22.5)), math.sin(math.radians(q * 90 + j * 22.5)))
+    for q, (sx, sy) in enumerate([(1, 1), (-1, 1), (-1, -1), (1, -1)])
+    for j in range(5)
+)
+
+
+def _fan_indices(n: int) -> list:
+    """Triangle indices filling a convex outline of n points around vertex 0."""
+    return [index for i in range(n) for index in (0, i + 1, (i + 1) % n + 1)]
+
+
+def _stroke_indices(n: int, closed: bool) -> list:
+    """Triangle indices for a stroke with an outer/inner vertex pair per point."""
+    indices = []
+    for i in range(n if closed else n - 1):
+        a = 2 * i
+        c = 2 * ((i + 1) % n)
+        indices.extend((a, a + 1, c, a + 1, c + 1, c))
+    return indices
+
+
+def _fan_vertices(cx, cy, outline, dx=0, dy=0) -> list:
+    """Mesh vertices for a filled outline of (x, y, nx, ny) points, offset by dx, dy."""
+    vertices = [cx + dx, cy + dy, 0, 0]
+    for x, y, _, _ in outline:
+        vertices.extend((x + dx, y + dy, 0, 0))
+    return vertices
+
+
+def _stroke_vertices(outline, half_width, dx=0, dy=0) -> list:
+    """Mesh vertices for a stroke of half_width centered on an outline."""
+    vertices = []
+    for x, y, nx, ny in outline:
+        ox = nx * half_width
+        oy = ny * half_width
+        vertices.extend((x + dx + ox, y + dy + oy, 0, 0, x + dx - ox, y + dy - oy, 0, 0))
+    return vertices
+
+
+class _HintButton:
+    """Geometry and state for one button in ChordHintWidget."""
+
+    __slots__ = ('name', 'bit', 'row', 'col', 'num_cols', 'indices', 'vertices', 'state')
+
+    def __init__(self, name, bit, row, col, num_cols):
+        self.name = name
+        self.bit = bit
+        self.row = row
+        self.col = col
+        self.num_cols = num_cols
+        self.indices = ()  # (shadow, fill, highlight, border) mesh indices, fixed
+        self.vertices = ()  # (shadow, fill, highlight, border) mesh vertices
+        self.state = 0  # Index into ChordHintWidget.STYLES
+
+
 class ChordHintWidget(Widget):
     """Small widget showing which buttons to press for a chord."""
 
@@ -165,203 +273,223 @@ class ChordHintWidget(Widget):
     COLOR_BTN_OFF = (0.28, 0.28, 0.30, 1)
     COLOR_BTN_ON = (0.2, 0.7, 0.3, 1)  # Green for correct buttons
     COLOR_BTN_WRONG = (0.8, 0.2, 0.2, 1)  # Red for wrong buttons
-    COLOR_SHADOW = (0.08, 0.08, 0.10, 1)
-    COLOR_HIGHLIGHT = (0.45, 0.45, 0.48, 1)
+    COLOR_SHADOW_ACTIVE = (0.05, 0.05, 0.05, 0.8)
+    COLOR_HIGHLIGHT_ON = (0.5, 1.0, 0.6, 0.9)  # Green highlight
+    COLOR_HIGHLIGHT_WRONG = (1.0, 0.5, 0.5, 0.9)  # Light red highlight
+    COLOR_BORDER_ON = (0.4, 1.0, 0.5, 1)  # Green border
+    COLOR_BORDER_WRONG = (0.6, 0.1, 0.1, 1)  # Dark red border
+    COLOR_NONE = (0, 0, 0, 0)  # Inactive buttons are a plain fill
+
+    # (shadow, fill, highlight, border) colors for inactive, expected, wrong
+    STYLES = (
+        (COLOR_NONE, COLOR_BTN_OFF, COLOR_NONE, COLOR_NONE),
+        (COLOR_SHADOW_ACTIVE, COLOR_BTN_ON, COLOR_HIGHLIGHT_ON, COLOR_BORDER_ON),
+        (COLOR_SHADOW_ACTIVE, COLOR_BTN_WRONG, COLOR_HIGHLIGHT_WRONG, COLOR_BORDER_WRONG),
+    )
 
     def __init__(self, chord_mask: int = 0, pressed_mask: int = 0, **kwargs):
         super().__init__(**kwargs)
         self.chord_mask = chord_mask
         self.pressed_mask = pressed_mask
-        self.bind(pos=self._update, size=self._update, chord_mask=self._update, pressed_mask=self._update)
-        self._update()
-
-    def _draw_hexagon(self, cx, cy, radius, color, is_active=False, is_wrong=False):
-        """Draw a hexagon centered at (cx, cy)."""
-        import math
-        points = []
-        for i in range(6):
-            angle = math.pi / 6 + i * math.pi / 3  # Start rotated for flat top
-            px = cx + radius * math.cos(angle)
-            py = cy + radius * math.sin(angle)
-            points.extend([px, py])
-
-        # Shadow (offset down-right)
-        if is_active:
-            Color(0.05, 0.05, 0.05, 0.8)
-        else:
-            Color(*self.COLOR_SHADOW)
-        shadow_points = [p + 2 if i % 2 == 0 else p - 2 for i, p in enumerate(points)]
-        Line(points=shadow_points + shadow_points[:2], width=1.5, close=True)
-
-        # Fill
-        Color(*color)
-        from kivy.graphics import Mesh
-        # Use triangle fan for filled hexagon
-        vertices = []
-        indices = []
-        # Center vertex
-        vertices.extend([cx, cy, 0, 0])
-        for i in range(6):
-            vertices.extend([points[i*2], points[i*2+1], 0, 0])
-        for i in range(6):
-            indices.extend([0, i+1, ((i+1) % 6) + 1])
-        Mesh(vertices=vertices, indices=indices, mode='triangles')
-
-        # Highlight (top edge)
-        if is_active:
-            if is_wrong:
-                Color(1.0, 0.5, 0.5, 0.9)  # Light red highlight
-            else:
-                Color(0.5, 1.0, 0.6, 0.9)  # Green highlight
-        else:
-            Color(*self.COLOR_HIGHLIGHT)
-        Line(points=points[:4], width=1.2)  # Top two edges
-
-        # Border
-        if is_active:
-            if is_wrong:
-                Color(0.6, 0.1, 0.1, 1)  # Dark red border
-            else:
-                Color(0.4, 1.0, 0.5, 1)  # Green border
-            Line(points=points + points[:2], width=1.5, close=True)
 
-    def _draw_circle(self, cx, cy, radius, color, is_active=False, is_wrong=False):
-        """Draw a circle with shadow/highlight."""
-        from kivy.graphics import Ellipse
-
-        # Shadow
-        if is_active:
-            Color(0.05, 0.05, 0.05, 0.8)
-        else:
-            Color(*self.COLOR_SHADOW)
-        Ellipse(pos=(cx - radius + 2, cy - radius - 2), size=(radius * 2, radius * 2))
+        self._buttons = []
+        for row_idx, row in enumerate(HINT_LAYOUT):
+            for col_idx, btn_name in enumerate(row):
+                if not btn_name:
+                    continue
+                btn = _HintButton(btn_name, BTN_BITS.get(btn_name, -1),
+                                  row_idx, col_idx, len(row))
+                # Hexagon shadow is an outline, circle/rect shadows are filled
+                if btn_name.startswith('T'):
+                    n = len(_HEX_UNIT)
+                    btn.indices = (_stroke_indices(n, True), _fan_indices(n),
+                                   _stroke_indices(2, False), _stroke_indices(n, True))
+                elif btn_name.startswith('F0'):
+                    n = len(_CIRCLE_UNIT)
+                    btn.indices = (_fan_indices(n), _fan_indices(n),
+                                   _stroke_indices(len(_ARC_UNIT), False), _stroke_indices(n, True))
+                else:
+                    n = len(_ROUND_CORNERS)
+                    btn.indices = (_fan_indices(n), _fan_indices(n),
+                                   _stroke_indices(2, False), _stroke_indices(n, True))
+                self._buttons.append(btn)
+
+        # All buttons share one Mesh per distinct color of each layer, drawn
+        # layer by layer; updates only refill the vertex lists
+        self._meshes = []
+        with self.canvas:
+            # Background
+            Color(*self.COLOR_BG)
+            self._bg = Rectangle()
+
+            for layer in range(4):
+                meshes = {}
+                for style in self.STYLES:
+                    rgba = style[layer]
+                    if rgba[3] > 0 and rgba not in meshes:
+                        Color(*rgba)
+                        meshes[rgba] = Mesh(mode='triangles')
+                self._meshes.append(meshes)
+
+        # Coalesce property changes within a frame: pos/size relayout, masks
+        # restyle, and either one refills the meshes once
+        self._layout_trigger = Clock.create_trigger(self._layout, 0)
+        self._restyle_trigger = Clock.create_trigger(self._restyle, 0)
+        self._batch_trigger = Clock.create_trigger(self._batch, 0)
+        self.bind(pos=self._layout_trigger, size=self._layout_trigger,
+                  chord_mask=self._restyle_trigger, pressed_mask=self._restyle_trigger)
+        self._layout()
+        self._restyle()
+
+    def _batch(self, *args):
+        """Refill the shared meshes from each button's geometry and state."""
+        for layer, meshes in enumerate(self._meshes):
+            batches = {rgba: ([], []) for rgba in meshes}
+            for btn in self._buttons:
+                batch = batches.get(self.STYLES[btn.state][layer])
+                if batch is None:
+                    continue  # Transparent, e.g. inactive border
+                vertices, indices = batch
+                base = len(vertices) // 4
+                vertices.extend(btn.vertices[layer])
+                indices.extend([base + i for i in btn.indices[layer]])
+            for rgba, (vertices, indices) in batches.items():
+                mesh = meshes[rgba]
+                mesh.vertices = vertices
+                mesh.indices = indices
+
+    def _layout(self, *args):
+        """Recompute every button's geometry for the current pos/size."""
+        self._bg.pos = self.pos
+        self._bg.size = self.size
 
-        # Fill
-        Color(*color)
-        Ellipse(pos=(cx - radius, cy - radius), size=(radius * 2, radius * 2))
+        rows = len(HINT_LAYOUT)
+        cell_h = self.height / rows
+        margin = 3
 
-        # Highlight arc (top)
-        if is_active:
-            if is_wrong:
-                Color(1.0, 0.5, 0.5, 0.9)  # Light red highlight
+        for btn in self._buttons:
+            cell_w = self.width / btn.num_cols
+
+            # All rows centered on widget center
+            cx = self.x + (btn.col + 0.5) * cell_w
+            cy = self.top - (btn.row + 0.5) * cell_h
+
+            # Outlines are (x, y, nx, ny) points with an outward normal
+            # Thumb buttons (T1-T4) = hexagons
+            if btn.name.startswith('T'):
+                radius = min(cell_w, cell_h) * 0.38
+                outline = [(cx + radius * ux, cy + radius * uy, ux * _HEX_MITER, uy * _HEX_MITER)
+                           for ux, uy in _HEX_UNIT]
+                # Shadow (offset down-right)
+                shadow = _stroke_vertices(outline, 1.5, 2, -2)
+                # Highlight along the first edge
+                (x0, y0, _, _), (x1, y1, _, _) = outline[0], outline[1]
+                length = math.hypot(x1 - x0, y1 - y0) or 1
+                nx, ny = (y1 - y0) / length, (x0 - x1) / length
+                highlight_line = [(x0, y0, nx, ny), (x1, y1, nx, ny)]
+
+            # F0 row = circles
+            elif btn.name.startswith('F0'):
+                radius = min(cell_w, cell_h) * 0.28
+                outline = [(cx + radius * ux, cy + radius * uy, ux, uy) for ux, uy in _CIRCLE_UNIT]
+                shadow = _fan_vertices(cx, cy, outline, 2, -2)
+                highlight_line = [(cx + radius * ux, cy + radius * uy, ux, uy) for ux, uy in _ARC_UNIT]
+
+            # Other finger buttons = square rounded rectangles
             else:
-                Color(0.5, 1.0, 0.6, 0.9)  # Green highlight
-        else:
-            Color(*self.COLOR_HIGHLIGHT)
-        Line(circle=(cx, cy, radius, 45, 135), width=1.2)
+                size = min(cell_w, cell_h) - margin * 2
+                half = size / 2
+                radius = 4
+                inset = half - radius
+                outline = [(cx + sx * inset + radius * nx, cy + sy * inset + radius * ny, nx, ny)
+                           for sx, sy, nx, ny in _ROUND_CORNERS]
+                shadow = _fan_vertices(cx, cy, outline, 2, -2)
+                # Highlight (top edge)
+                highlight_line = [(cx - inset, cy + half, 0, 1), (cx + inset, cy + half, 0, 1)]
+
+            btn.vertices = (
+                shadow,
+                _fan_vertices(cx, cy, outline),
+                _stroke_vertices(highlight_line, 1.2),
+                _stroke_vertices(outline, 1.5),
+            )
 
-        # Border for active
-        if is_active:
-            if is_wrong:
-                Color(0.6, 0.1, 0.1, 1)  # Dark red border
+        self._batch_trigger()
+
+    def _restyle(self, *args):
+        """Rebatch buttons into color meshes if any expected/wrong state changed."""
+        chord_mask = int(self.chord_mask)
+        pressed_mask = int(self.pressed_mask)
+
+        changed = False
+        for btn in self._buttons:
+            # Check if this button is in the expected chord or was wrongly pressed
+            bit = btn.bit
+            is_expected = bit >= 0 and (chord_mask >> bit) & 1
+            is_pressed = bit >= 0 and (pressed_mask >> bit) & 1
+
+            # Green for correct, red for wrong, gray for inactive
+            if is_expected:
+                state = 1
+            elif is_pressed:
+                state = 2
             else:
-                Color(0.4, 1.0, 0.5, 1)  # Green border
-            Line(circle=(cx, cy, radius), width=1.5)
+                state = 0
 
-    def _draw_rounded_rect(self, x, y, w, h, color, is_active=False, is_wrong=False):
-        """Draw a rounded rectangle with shadow/highlight."""
-        radius = 4
+            if state != btn.state:
+                btn.state = state
+                changed = True
 
-        # Shadow
-        if is_active:
-            Color(0.05, 0.05, 0.05, 0.8)
-        else:
-            Color(*self.COLOR_SHADOW)
-        RoundedRectangle(pos=(x + 2, y - 2), size=(w, h), radius=[radius])
+        if changed:
+            self._batch_trigger()
 
-        # Fill
-        Color(*color)
-        RoundedRectangle(pos=(x, y), size=(w, h), radius=[radius])
 
-        # Highlight (top edge)
-        if is_active:
-            if is_wrong:
-                Color(1.0, 0.5, 0.5, 0.9)  # Light red highlight
-            else:
-                Color(0.5, 1.0, 0.6, 0.9)  # Green highlight
-        else:
-            Color(*self.COLOR_HIGHLIGHT)
-        Line(points=[x + radius, y + h, x + w - radius, y + h], width=1.2)
+# Lesson definitions: (name, description, filter_func)
+# filter_func(rows, btn_count) takes the chord's ROW_FLAGS bits and button count
+# Ordered from easiest to hardest
+LESSONS = [
+    ('F1+F2', 'Row 1 + Row 2 (9 letters)', lambda rows, n: rows == ROW_FLAGS['F1'] | ROW_FLAGS['F2']),
+    ('F1+F3', 'Row 1 + Row 3', lambda rows, n: rows == ROW_FLAGS['F1'] | ROW_FLAGS['F3']),
+    ('F2+F3', 'Row 2 + Row 3', lambda rows, n: rows == ROW_FLAGS['F2'] | ROW_FLAGS['F3']),
+    ('F1+F4', 'Row 1 + Row 4', lambda rows, n: rows == ROW_FLAGS['F1'] | ROW_FLAGS['F4']),
+    ('F2+F4', 'Row 2 + Row 4', lambda rows, n: rows == ROW_FLAGS['F2'] | ROW_FLAGS['F4']),
+    ('F3+F4', 'Row 3 + Row 4', lambda rows, n: rows == ROW_FLAGS['F3'] | ROW_FLAGS['F4']),
+    ('3-finger', 'Three finger chords',
+     lambda rows, n: n == 3 and rows.bit_count() == 3 and not rows & ROW_FLAGS['T1']),
+    ('Num+*', 'Number row (T1 thumb)',
+     lambda rows, n: bool(rows & ROW_FLAGS['T1']) and rows.bit_count() == 2),
+    ('All 2-btn', 'All two-button chords', lambda rows, n: n == 2),
+]
 
-        # Border for active
-        if is_active:
-            if is_wrong:
-                Color(0.6, 0.1, 0.1, 1)  # Dark red border
-            else:
-                Color(0.4, 1.0, 0.5, 1)  # Green border
-            Line(rounded_rectangle=(x, y, w, h, radius), width=1.5)
+# Finger rows named in each lesson (e.g. ['F1', 'F3'] for 'F1+F3')
+_LESSON_ROWS = {name: [row for row in ('F1', 'F2', 'F3', 'F4') if row in name]
+                for name, _, _ in LESSONS}
 
-    def _update(self, *args):
-        self.canvas.clear()
+# Filters only distinguish button counts up to 3, so larger counts share a key
+_MAX_LESSON_BTNS = 4
 
-        rows = len(HINT_LAYOUT)
-        cell_h = self.height / rows
-        margin = 3
 
-        with self.canvas:
-            # Background
-            Color(*self.COLOR_BG)
-            Rectangle(pos=self.pos, size=self.size)
-
-            # Draw each button
-            for row_idx, row in enumerate(HINT_LAYOUT):
-                num_cols = len(row)
-                cell_w = self.width / num_cols
-
-                for col_idx, btn_name in enumerate(row):
-                    if not btn_name:
-                        continue
-
-                    # All rows centered on widget center
-                    cx = self.x + (col_idx + 0.5) * cell_w
-                    cy = self.top - (row_idx + 0.5) * cell_h
-
-                    # Check if this button is in the expected chord or was wrongly pressed
-                    bit = BTN_BITS.get(btn_name, -1)
-                    is_expected = bit >= 0 and (self.chord_mask & (1 << bit))
-                    is_pressed = bit >= 0 and (self.pressed_mask & (1 << bit))
-                    is_wrong = is_pressed and not is_expected
-
-                    # Color: green for correct, red for wrong, gray for inactive
-                    if is_expected:
-                        color = self.COLOR_BTN_ON
-                        is_active = True
-                    elif is_wrong:
-                        color = self.COLOR_BTN_WRONG
-                        is_active = True
-                    else:
-                        color = self.COLOR_BTN_OFF
-                        is_active = False
-
-                    # Thumb buttons (T1-T4) = hexagons
-                    if btn_name.startswith('T'):
-                        radius = min(cell_w, cell_h) * 0.38
-                        self._draw_hexagon(cx, cy, radius, color, is_active, is_wrong)
-                    # F0 row = circles
-                    elif btn_name.startswith('F0'):
-                        radius = min(cell_w, cell_h) * 0.28
-                        self._draw_circle(cx, cy, radius, color, is_active, is_wrong)
-                    # Other finger buttons = square rounded rectangles
-                    else:
-                        size = min(cell_w, cell_h) - margin * 2
-                        x = cx - size / 2
-                        y = cy - size / 2
-                        self._draw_rounded_rect(x, y, size, size, color, is_active, is_wrong)
+@functools.lru_cache(maxsize=None)
+def _lessons_for(rows: int, btn_count: int) -> tuple:
+    """Names of the lessons matching a (ROW_FLAGS bits, capped button count) pair."""
+    return tuple(name for name, _, filter_func in LESSONS if filter_func(rows, btn_count))
 
 
-# Lesson definitions: (name, description, filter_func)
-# Ordered from easiest to hardest
-LESSONS = [
-    ('F1+F2', 'Row 1 + Row 2 (9 letters)', lambda rows: rows == {'F1', 'F2'}),
-    ('F1+F3', 'Row 1 + Row 3', lambda rows: rows == {'F1', 'F3'}),
-    ('F2+F3', 'Row 2 + Row 3', lambda rows: rows == {'F2', 'F3'}),
-    ('F1+F4', 'Row 1 + Row 4', lambda rows: rows == {'F1', 'F4'}),
-    ('F2+F4', 'Row 2 + Row 4', lambda rows: rows == {'F2', 'F4'}),
-    ('F3+F4', 'Row 3 + Row 4', lambda rows: rows == {'F3', 'F4'}),
-    ('3-finger', 'Three finger chords', lambda rows: len(rows) == 3 and 'T1' not in rows),
-    ('Num+*', 'Number row (T1 thumb)', lambda rows: 'T1' in rows and len(rows) == 2),
-    ('All 2-btn', 'All two-button chords', lambda rows: True),  # filtered by button count
-]
+# Rounds cover every 3-char combo of the practice set up to this many combos
+# (10 chars); larger sets draw a random sample of this size instead
+MAX_ROUND_COMBOS = 1000
+
+# Only the current char set is reused (round after round); subsets grow one
+# char at a time, so older sets are never asked for again and can be large
+@functools.lru_cache(maxsize=2)
+def _permutations(chars: tuple, combo_length: int) -> tuple:
+    """All strings of combo_length over chars, in itertools.product order."""
+    # Extend prefixes one char at a time, so each string is one concatenation
+    # rather than a join over a tuple
+    perms = list(chars) if combo_length > 0 else ['']
+    for _ in range(combo_length - 1):
+        perms = [prefix + c for prefix in perms for c in chars]
+    return tuple(perms)
 
 
 class ExerciseDisplay(Widget):
@@ -374,104 +502,145 @@ class ExerciseDisplay(Widget):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.bind(
-            pos=self._update_canvas,
-            size=self._update_canvas,
-            target_text=self._update_canvas,
-            typed_text=self._update_canvas,
-            cursor_pos=self._update_canvas
-        )
-        self._update_canvas()
+        self._correct = b''  # 1 where typed_text matches target_text
+        self._drawn_state = None  # Inputs of the last redraw
 
-    def _update_canvas(self, *args):
-        self.canvas.clear()
         with self.canvas:
             # Background
             Color(0.12, 0.12, 0.12)
-            Rectangle(pos=self.pos, size=self.size)
+            self._bg = Rectangle()
 
             # Border
             Color(0.3, 0.3, 0.3)
-            Line(rectangle=(*self.pos, *self.size), width=1)
+            self._border = Line(width=1)
+
+        # Text instructions are kept between updates and only mutated
+        self._slot_colors = []
+        self._slot_rects = []
+        with self.canvas.after:
+            Color(0.5, 0.5, 0.5, 1)
+            self._placeholder = Rectangle(size=(0, 0))
+            self._slots = InstructionGroup()  # One Color + Rectangle per visible char
+            Color(1.0, 1.0, 0.3, 1)
+            self._cursor = Line(width=2)
+
+        # A keystroke changes typed_text and cursor_pos together; redraw once per frame
+        self._redraw_trigger = Clock.create_trigger(self._update_canvas)
+        self.bind(
+            pos=self._redraw_trigger,
+            size=self._redraw_trigger,
+            target_text=self._on_text,
+            typed_text=self._on_text,
+            cursor_pos=self._redraw_trigger,
+            visible_chars=self._redraw_trigger
+        )
+        self._update_canvas()
+
+    def _on_text(self, *args):
+        """Recompute per-character correctness, then schedule a redraw."""
+        self._correct = bytes(map(eq, self.typed_text, self.target_text))
+        self._redraw_trigger()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _glyph(text, font_size, bold=False):
+        """Rendered label texture, shared by all displays per (text, font_size, bold)."""
+        label = CoreLabel(text=text, font_size=font_size, bold=bold)
+        label.refresh()
+        return label.texture
+
+    def _update_canvas(self, *args):
+        state = (tuple(self.pos), tuple(self.size), self.target_text, self._correct,
+                 self.cursor_pos, self.visible_chars)
+        if state == self._drawn_state:
+            return
+        self._drawn_state = state
 
-        # Clear after canvas for text
-        self.canvas.after.clear()
+        self._bg.pos = self.pos
+        self._bg.size = self.size
+        self._border.rectangle = (*self.pos, *self.size)
 
         if not self.target_text:
             # Show placeholder - use dp() for proper scaling
-            with self.canvas.after:
-                label = CoreLabel(text='Press Start to begin', font_size=dp(28))
-                label.refresh()
-                texture = label.texture
-                Color(0.5, 0.5, 0.5, 1)
-                Rectangle(
-                    texture=texture,
-                    pos=(self.center_x - texture.width / 2, self.center_y - texture.height / 2),
-                    size=texture.size
-                )
+            texture = self._glyph('Press Start to begin', dp(28))
+            self._placeholder.texture = texture
+            self._placeholder.pos = (self.center_x - texture.width / 2, self.center_y - texture.height / 2)
+            self._placeholder.size = texture.size
+            for rect in self._slot_rects:
+                rect.size = (0, 0)
+            self._cursor.points = []
             return
+        self._placeholder.size = (0, 0)
 
         # Draw scrolling text display - use dp() for scaling
-        with self.canvas.after:
-            font_size = dp(28)
-            char_width = font_size * 0.65  # Monospace width
-
-            # Calculate visible window - cursor at 1/4 from left for look-ahead
-            cursor_screen_pos = 0.25  # Cursor position as fraction of width
-            chars_before = int(self.visible_chars * cursor_screen_pos)
-            chars_after = self.visible_chars - chars_before
-
-            # Window start/end in the full text
-            window_start = max(0, self.cursor_pos - chars_before)
-            window_end = min(len(self.target_text), self.cursor_pos + chars_after)
-
-            # Calculate starting X position
-            # The cursor char should be at cursor_screen_pos of the widget width
-            cursor_x = self.x + self.width * cursor_screen_pos
-            start_x = cursor_x - (self.cursor_pos - window_start) * char_width
-
-            # Draw characters in the visible window
-            for i in range(window_start, window_end):
-                char = self.target_text[i]
-                x = start_x + (i - window_start) * char_width
-
-                # Skip if outside widget bounds
-                if x < self.x - char_width or x > self.right + char_width:
-                    continue
+        font_size = dp(28)
+        char_width = font_size * 0.65  # Monospace width
+
+        # Calculate visible window - cursor at 1/4 from left for look-ahead
+        cursor_screen_pos = 0.25  # Cursor position as fraction of width
+        chars_before = int(self.visible_chars * cursor_screen_pos)
+        chars_after = self.visible_chars - chars_before
+
+        # Window start/end in the full text
+        window_start = max(0, self.cursor_pos - chars_before)
+        window_end = min(len(self.target_text), self.cursor_pos + chars_after)
+
+        # Calculate starting X position
+        # The cursor char should be at cursor_screen_pos of the widget width
+        cursor_x = self.x + self.width * cursor_screen_pos
+        start_x = cursor_x - (self.cursor_pos - window_start) * char_width
+
+        # Draw characters in the visible window
+        correct = self._correct
+        used = 0
+        for i, char in enumerate(self.target_text[window_start:window_end], window_start):
+            x = start_x + (i - window_start) * char_width
+
+            # Skip if outside widget bounds
+            if x < self.x - char_width or x > self.right + char_width:
+                continue
 
-                # Color based on position relative to cursor
-                if i < self.cursor_pos:
-                    # Already typed - check if correct
-                    if i < len(self.typed_text) and self.typed_text[i] == char:
-                        Color(0.3, 0.7, 0.3, 0.6)  # Faded green - correct
-                    else:
-                        Color(0.7, 0.3, 0.3, 0.6)  # Faded red - incorrect
-                elif i == self.cursor_pos:
-                    Color(1.0, 1.0, 0.3, 1)  # Bright yellow - current
+            if used == len(self._slot_rects):
+                self._slot_colors.append(Color())
+                self._slot_rects.append(Rectangle())
+                self._slots.add(self._slot_colors[used])
+                self._slots.add(self._slot_rects[used])
+            color = self._slot_colors[used]
+            rect = self._slot_rects[used]
+            used += 1
+
+            # Color based on position relative to cursor
+            if i < self.cursor_pos:
+                # Already typed - check if correct
+                if i < len(correct) and correct[i]:
+                    color.rgba = (0.3, 0.7, 0.3, 0.6)  # Faded green - correct
                 else:
-                    # Upcoming - fade based on distance
-                    distance = i - self.cursor_pos
-                    fade = max(0.4, 1.0 - distance * 0.03)
-                    Color(0.8, 0.8, 0.8, fade)  # White/gray - upcoming
-
-                is_current = (i == self.cursor_pos)
-                label = CoreLabel(text=char, font_size=font_size if not is_current else font_size + 4, bold=is_current)
-                label.refresh()
-
-                # Center vertically, with current char slightly raised
-                y_offset = 4 if is_current else 0
-                Rectangle(
-                    texture=label.texture,
-                    pos=(x - label.texture.width / 2, self.center_y - label.texture.height / 2 + y_offset),
-                    size=label.texture.size
-                )
-
-            # Draw cursor underline
-            Color(1.0, 1.0, 0.3, 1)
-            cursor_char_x = cursor_x - char_width / 2
-            Line(points=[cursor_char_x, self.center_y - font_size / 2 - 5,
-                        cursor_char_x + char_width, self.center_y - font_size / 2 - 5], width=2)
+                    color.rgba = (0.7, 0.3, 0.3, 0.6)  # Faded red - incorrect
+            elif i == self.cursor_pos:
+                color.rgba = (1.0, 1.0, 0.3, 1)  # Bright yellow - current
+            else:
+                # Upcoming - fade based on distance
+                distance = i - self.cursor_pos
+                fade = max(0.4, 1.0 - distance * 0.03)
+                color.rgba = (0.8, 0.8, 0.8, fade)  # White/gray - upcoming
 
+            is_current = (i == self.cursor_pos)
+            texture = self._glyph(char, font_size if not is_current else font_size + 4, is_current)
+
+            # Center vertically, with current char slightly raised
+            y_offset = 4 if is_current else 0
+            rect.texture = texture
+            rect.pos = (x - texture.width / 2, self.center_y - texture.height / 2 + y_offset)
+            rect.size = texture.size
+
+        # Hide slots left over from a wider window
+        for rect in self._slot_rects[used:]:
+            rect.size = (0, 0)
+
+        # Draw cursor underline
+        cursor_char_x = cursor_x - char_width / 2
+        self._cursor.points = [cursor_char_x, self.center_y - font_size / 2 - 5,
+                               cursor_char_x + char_width, self.center_y - font_size / 2 - 5]
 
 
 class ExerciseStats(BoxLayout):
@@ -510,20 +679,38 @@ class ExerciseStats(BoxLayout):
         self.add_widget(self.accuracy_label)
         self.add_widget(self.progress_label)
 
+        # Each property only reformats its own label; the 10Hz timer mostly
+        # moves elapsed_time, whose text changes once a second
+        self._shown_secs = 0
+        self._shown_wpm = 0
+        self._shown_accuracy = 100
         self.bind(
-            elapsed_time=self._update_labels,
-            wpm=self._update_labels,
-            accuracy=self._update_labels,
-            progress_current=self._update_labels,
-            progress_total=self._update_labels
+            elapsed_time=self._update_time,
+            wpm=self._update_wpm,
+            accuracy=self._update_accuracy,
+            progress_current=self._update_progress,
+            progress_total=self._update_progress
         )
 
-    def _update_labels(self, *args):
-        mins = int(self.elapsed_time) // 60
-        secs = int(self.elapsed_time) % 60
-        self.time_label.text = f'Time: {mins:02d}:{secs:02d}'
-        self.wpm_label.text = f'WPM: {self.wpm:.0f}'
-        self.accuracy_label.text = f'Accuracy: {self.accuracy:.0f}%'
+    def _update_time(self, *args):
+        secs = int(self.elapsed_time)
+        if secs != self._shown_secs:
+            self._shown_secs = secs
+            self.time_label.text = f'Time: {secs // 60:02d}:{secs % 60:02d}'
+
+    def _update_wpm(self, *args):
+        wpm = round(self.wpm)
+        if wpm != self._shown_wpm:
+            self._shown_wpm = wpm
+            self.wpm_label.text = f'WPM: {wpm}'
+
+    def _update_accuracy(self, *args):
+        accuracy = round(self.accuracy)
+        if accuracy != self._shown_accuracy:
+            self._shown_accuracy = accuracy
+            self.accuracy_label.text = f'Accuracy: {accuracy}%'
+
+    def _update_progress(self, *args):
         self.progress_label.text = f'Progress: {self.progress_current}/{self.progress_total}'
 
 
@@ -542,21 +729,29 @@ class ExerciseView(BoxLayout):
         # State
         self._chord_groups = {}
         self._target_text = ''
+        self._total_chars = 0  # len(_target_text), kept in step by _set_target
         self._typed_text = ''
         self._cursor_pos = 0
         self._start_time = 0
         self._is_running = False
         self._correct_count = 0
         self._total_typed = 0
+        self._stats_dirty = False  # Counts changed since the timer last recomputed accuracy
         self._prev_buttons = 0  # Track button state for chord detection
+        self._char_to_mask = {}  # Keyboard output -> chord mask, see _index_chars
+        self._chord_cache = {}  # Chord mask -> config.find_chord result
+        self._cached_revision = None  # (config, revision) the chord caches were built for
         self._timer_event = None
+        # One reusable event clears a wrong char 2s after the latest mistake
+        self._incorrect_trigger = Clock.create_trigger(self._remove_incorrect_char, 2.0)
         self._hint_popup = None  # Track current hint popup
+        self._hint_view = None  # Hint popup, built on first use and reused
         self._hint_min_time = 0  # Minimum time hint should stay open
         self._always_show_hint = False  # Always show chord hint mode
         self._last_pressed_chord = 0  # Track last pressed chord for showing wrong buttons
         self._current_chars = []  # Current subset of characters being practiced
         self._all_lesson_chars = []  # All characters available in current lesson
-        self._permutation_queue = []  # Queue of 3-letter combinations to practice
+        self._permutation_queue = deque()  # Queue of 3-letter combinations to practice
         self._completed_count = 0  # Total combinations completed across all rounds
         self._missed_char = None  # Character that was missed, to reinforce in next target
         self._fixed_row = None  # Which row is fixed (e.g., 'F1')
@@ -592,7 +787,6 @@ class ExerciseView(BoxLayout):
         self.subset_spinner = Spinner(text='2', values=['2', '3', '4', '5', '6'])
 
         # Show Hints toggle
-        from kivy.uix.togglebutton import ToggleButton
         self.hint_toggle = ToggleButton(text='Hints', size_hint_x=0.12)
         self.hint_toggle.bind(state=self._on_hint_toggle)
 
@@ -627,51 +821,67 @@ class ExerciseView(BoxLayout):
     def load_config(self, config):
         """Load chord config and group by lesson categories"""
         self.config = config
+        self._sync_chord_caches()
         self._group_chords_by_lesson()
         self._update_chars_spinner()
 
         self.status_label.text = f'{len(config.entries)} chords loaded — select chars to begin'
 
-    def _get_rows_for_chord(self, mask: int) -> set:
-        """Get which rows/thumbs are used in a chord."""
-        rows = set()
-        for row_name, bits in ROW_BITS.items():
-            if any(mask & (1 << bit) for bit in bits):
-                rows.add(row_name)
-        for thumb_name, bit in THUMB_BITS.items():
-            if mask & (1 << bit):
-                rows.add(thumb_name)
-        return rows
+    def _sync_chord_caches(self):
+        """Drop chord lookups built for an older config or before a chord edit."""
+        config = self.config
+        revision = (config, config.revision) if config else None
+        if revision == self._cached_revision:
+            return
+        self._cached_revision = revision
+        self._chord_cache = {}
+        self._index_chars()
+
+    def _index_chars(self):
+        """Map each keyboard output to the first chord producing it, for hints."""
+        self._char_to_mask = {}
+        if not self.config:
+            return
+        for entry in self.config.entries:
+            if entry.is_keyboard:
+                self._char_to_mask.setdefault(entry.key_str(), entry.chord_mask)
+
+    def _get_rows_for_chord(self, mask: int) -> int:
+        """Get which rows/thumbs are used in a chord, as ROW_FLAGS bits."""
+        return _ROW_FLAGS_LO[mask & 0x3FF] | _ROW_FLAGS_HI[(mask >> 10) & 0x3FF]
 
     def _group_chords_by_lesson(self):
-        """Pre-compute chord groups for each lesson."""
+        """Pre-compute chord groups and their printable chars for each lesson."""
         self._lesson_entries = {}
+        self._lesson_chars = {}
+        self._chars_options = {}  # Chars spinner options per lesson, built on first view
 
         if not self.config:
             return
 
-        for lesson_name, desc, filter_func in LESSONS:
-            entries = []
-            for entry in self.config.entries:
-                if not entry.is_keyboard:
-                    continue
-                rows = self._get_rows_for_chord(entry.chord_mask)
-                # Special handling for button count filters
-                btn_count = bin(entry.chord_mask).count('1')
-                if lesson_name == 'All 2-btn':
-                    if btn_count == 2:
-                        entries.append(entry)
-                elif lesson_name == '3-finger':
-                    if btn_count == 3 and filter_func(rows):
-                        entries.append(entry)
-                elif filter_func(rows):
-                    entries.append(entry)
-            self._lesson_entries[lesson_name] = entries
+        for lesson_name, _, _ in LESSONS:
+            self._lesson_entries[lesson_name] = []
+
+        # Rows and button count depend only on the entry, so compute them once
+        for entry in self.config.entries:
+            if not entry.is_keyboard:
+                continue
+            rows = self._get_rows_for_chord(entry.chord_mask)
+            btn_count = min(entry.chord_mask.bit_count(), _MAX_LESSON_BTNS)
+            for lesson_name in _lessons_for(rows, btn_count):
+                self._lesson_entries[lesson_name].append(entry)
+
+        for lesson_name, entries in self._lesson_entries.items():
+            self._lesson_chars[lesson_name] = self._get_printable_chars(entries)
 
     def _get_lesson_entries(self, lesson_name: str) -> list:
         """Get chord entries for a lesson."""
         return self._lesson_entries.get(lesson_name, [])
 
+    def _get_lesson_chars(self, lesson_name: str) -> list:
+        """Get single-character outputs for a lesson."""
+        return self._lesson_chars.get(lesson_name, [])
+
     def _get_printable_chars(self, entries: list) -> list:
         """Get single-character outputs from entries."""
         chars = []
@@ -683,16 +893,11 @@ class ExerciseView(BoxLayout):
 
     def _get_rows_in_lesson(self, lesson_name: str) -> list:
         """Get which finger rows are used in a lesson (e.g., ['F1', 'F3'] for 'F1+F3')."""
-        rows = []
-        for row in ['F1', 'F2', 'F3', 'F4']:
-            if row in lesson_name:
-                rows.append(row)
-        return rows
+        return _LESSON_ROWS.get(lesson_name, [])
 
     def _get_button_bit(self, row: str, col: str) -> int:
         """Get bit position for a specific button (e.g., 'F1', 'L' -> bit for F1L)."""
-        btn_name = f'{row}{col}'
-        return BTN_BITS.get(btn_name, -1)
+        return _ROW_COL_BITS.get((row, col), -1)
 
     def _filter_entries_by_fixed_button(self, entries: list, fixed_row: str, fixed_col: str, varying_row: str) -> list:
         """Filter entries to only those using the fixed button + any button from varying row."""
@@ -700,29 +905,36 @@ class ExerciseView(BoxLayout):
         if fixed_bit < 0:
             return entries
 
-        # Get all bits for the varying row
-        varying_bits = ROW_BITS.get(varying_row, [])
+        fixed_mask = 1 << fixed_bit
+        varying_mask = ROW_MASKS[varying_row] if varying_row in ROW_BITS else 0
 
-        filtered = []
-        for entry in entries:
-            mask = entry.chord_mask
-            # Must have the fixed button pressed
-            if not (mask & (1 << fixed_bit)):
-                continue
-            # Must have exactly one button from varying row
-            varying_pressed = [b for b in varying_bits if mask & (1 << b)]
-            if len(varying_pressed) == 1:
-                filtered.append(entry)
-        return filtered
+        # Fixed button pressed, plus exactly one button from the varying row
+        return [entry for entry in entries
+                if entry.chord_mask & fixed_mask
+                and (entry.chord_mask & varying_mask).bit_count() == 1]
 
     def _generate_permutations(self, chars: list, combo_length: int = 3) -> list:
         """Generate all permutations with repetition of given length."""
-        from itertools import product
-        return [''.join(p) for p in product(chars, repeat=combo_length)]
+        # Each round reshuffles the same char set, so the base list is cached
+        # and callers get a fresh copy to shuffle
+        return list(_permutations(tuple(chars), combo_length))
+
+    def _shuffled_combos(self, chars: list) -> list:
+        """3-char combos for one round in random order, sampled for large char sets."""
+        n = len(chars)
+        total = n ** 3
+        if total <= MAX_ROUND_COMBOS:
+            perms = self._generate_permutations(chars)
+            random.shuffle(perms)
+            return perms
+        # Decode sampled indices (base n, same order as _generate_permutations)
+        # rather than building all n**3 strings
+        return [chars[i // (n * n)] + chars[i // n % n] + chars[i % n]
+                for i in random.sample(range(total), MAX_ROUND_COMBOS)]
 
     def _get_words_for_chars(self, chars: set) -> list:
         """Filter WORD_LIST to words using only the given character set."""
-        return [w for w in WORD_LIST if set(w) <= chars]
+        return list(words_for_letters(letter_mask(chars)))
 
     def _generate_word_round(self, chars: set) -> str:
         """Generate a word practice round from learned chars.
@@ -738,6 +950,11 @@ class ExerciseView(BoxLayout):
         separator = ' ' if ' ' in chars else ''
         return separator.join(selected)
 
+    def _set_target(self, text: str):
+        """Set the exercise text along with its cached length."""
+        self._target_text = text
+        self._total_chars = len(text)
+
     def _get_next_target(self) -> str:
         """Get the next target string from the permutation queue."""
         if not self._current_chars:
@@ -745,12 +962,10 @@ class ExerciseView(BoxLayout):
 
         if not self._permutation_queue:
             # Regenerate and shuffle
-            perms = self._generate_permutations(self._current_chars)
-            random.shuffle(perms)
-            self._permutation_queue = perms
+            self._permutation_queue = deque(self._shuffled_combos(self._current_chars))
 
         if self._permutation_queue:
-            return self._permutation_queue.pop(0)
+            return self._permutation_queue.popleft()
         return ''
 
     def _on_lesson_changed(self, spinner, text):
@@ -774,6 +989,18 @@ class ExerciseView(BoxLayout):
             return
 
         lesson_name = self.group_spinner.text
+        options = self._chars_options.get(lesson_name)
+        if options is None:
+            options = self._chars_options[lesson_name] = self._build_chars_options(lesson_name)
+
+        self.chars_spinner.values = options
+        if options:
+            self.chars_spinner.text = options[0]
+        else:
+            self.chars_spinner.text = '(no chars)'
+
+    def _build_chars_options(self, lesson_name: str) -> list:
+        """Chars dropdown entries for a lesson."""
         entries = self._get_lesson_entries(lesson_name)
         rows_in_lesson = self._get_rows_in_lesson(lesson_name)
 
@@ -793,15 +1020,10 @@ class ExerciseView(BoxLayout):
                         options.append(label)
         else:
             # Non-2-row lessons: just show all chars
-            chars = self._get_printable_chars(entries)
+            chars = self._get_lesson_chars(lesson_name)
             if chars:
                 options.append(f"All: {''.join(chars)}")
-
-        self.chars_spinner.values = options
-        if options:
-            self.chars_spinner.text = options[0]
-        else:
-            self.chars_spinner.text = '(no chars)'
+        return options
 
     def _parse_chars_selection(self, text: str):
         """Parse chars spinner text to extract fixed row/col/varying and chars.
@@ -841,10 +1063,7 @@ class ExerciseView(BoxLayout):
         self.subset_spinner.text = str(subset_size)
 
         # Generate exercise text
-        perms = self._generate_permutations(self._current_chars)
-        random.shuffle(perms)
-        self._target_text = ''.join(perms)
-        self._total_chars = len(self._target_text)
+        self._set_target(''.join(self._shuffled_combos(self._current_chars)))
         self._completed_count = 0
 
         # Reset state but don't start timer yet
@@ -880,7 +1099,7 @@ class ExerciseView(BoxLayout):
             return
         if not self._target_text:
             return
-        self._start_time = time.time()
+        self._start_time = time.monotonic()
         self._is_running = True
         self._timer_event = Clock.schedule_interval(self._update_timer, 0.1)
         chars_str = ''.join(self._current_chars)
@@ -907,7 +1126,7 @@ class ExerciseView(BoxLayout):
             self._timer_event.cancel()
             self._timer_event = None
 
-        self._target_text = ''
+        self._set_target('')
         self._typed_text = ''
         self._cursor_pos = 0
 
@@ -924,9 +1143,7 @@ class ExerciseView(BoxLayout):
         self.status_label.text = 'Ready'
 
         # Close hint popup if open
-        if self._hint_popup:
-            self._hint_popup.dismiss()
-            self._hint_popup = None
+        self._dismiss_hint()
 
         # Reset keyboard chord state
         self._kb_buttons = 0
@@ -941,12 +1158,11 @@ class ExerciseView(BoxLayout):
 
         if self._always_show_hint and self._target_text:
             # Show hint for current target
-            if self._cursor_pos < len(self._target_text):
+            if self._cursor_pos < self._total_chars:
                 self._show_chord_hint(self._target_text[self._cursor_pos])
-        elif not self._always_show_hint and self._hint_popup:
+        elif not self._always_show_hint:
             # Hide hint when turning off
-            self._hint_popup.dismiss()
-            self._hint_popup = None
+            self._dismiss_hint()
 
     def _on_kb_toggle(self, instance, state):
         """Toggle QWERTY keyboard chord input mode"""
@@ -968,17 +1184,17 @@ class ExerciseView(BoxLayout):
 
     def _on_kb_key_down(self, window, key, scancode, codepoint, modifiers):
         """Handle QWERTY key press -> update chord button bitmask"""
-        if key in KB_TO_BTN:
-            bit = KB_TO_BTN[key]
-            self._kb_buttons |= (1 << bit)
+        mask = KB_TO_MASK.get(key)
+        if mask:
+            self._kb_buttons |= mask
             self.on_chord_event(self._kb_buttons)
             return True  # Consume the event
 
     def _on_kb_key_up(self, window, key, scancode):
         """Handle QWERTY/numpad key release -> update chord button bitmask"""
-        if key in KB_TO_BTN:
-            bit = KB_TO_BTN[key]
-            self._kb_buttons &= ~(1 << bit)
+        mask = KB_TO_MASK.get(key)
+        if mask:
+            self._kb_buttons &= ~mask
             self.on_chord_event(self._kb_buttons)
             return True  # Consume the event
 
@@ -987,15 +1203,16 @@ class ExerciseView(BoxLayout):
         if not self._is_running:
             return
 
-        elapsed = time.time() - self._start_time
+        elapsed = time.monotonic() - self._start_time
         self.stats.elapsed_time = elapsed
 
         # Calculate WPM (5 chars per word)
         if elapsed > 0 and self._total_typed > 0:
             self.stats.wpm = (self._total_typed / 5) / (elapsed / 60)
 
-        # Calculate accuracy
-        if self._total_typed > 0:
+        # Calculate accuracy, which only moves when a char is typed
+        if self._stats_dirty and self._total_typed > 0:
+            self._stats_dirty = False
             self.stats.accuracy = (self._correct_count / self._total_typed) * 100
 
     def on_chord_event(self, buttons: int):
@@ -1007,21 +1224,21 @@ class ExerciseView(BoxLayout):
         """
         # Dismiss hint popup when all buttons released (unless always-show mode or min time not elapsed)
         if self._hint_popup and buttons == 0 and not self._always_show_hint:
-            if time.time() >= self._hint_min_time:
-                self._hint_popup.dismiss()
-                self._hint_popup = None
-
-        # Detect any button release (button count decreased)
-        prev_count = bin(self._prev_buttons).count('1')
-        curr_count = bin(buttons).count('1')
+            if time.monotonic() >= self._hint_min_time:
+                self._dismiss_hint()
 
-        if self._prev_buttons != 0 and curr_count < prev_count:
+        # Detect any button release (a previously held bit is now clear)
+        if self._prev_buttons & ~buttons:
             # A button was released - use the previous state as the chord
             chord_mask = self._prev_buttons
             self._last_pressed_chord = chord_mask
 
             if self.config:
-                entry = self.config.find_chord(chord_mask)
+                # The chord map tab edits this config in place
+                self._sync_chord_caches()
+                if chord_mask not in self._chord_cache:
+                    self._chord_cache[chord_mask] = self.config.find_chord(chord_mask)
+                entry = self._chord_cache[chord_mask]
                 if entry and entry.is_keyboard:
                     char = entry.key_str()
                     if len(char) == 1:
@@ -1043,7 +1260,7 @@ class ExerciseView(BoxLayout):
             else:
                 return
 
-        if self._cursor_pos >= len(self._target_text):
+        if self._cursor_pos >= self._total_chars:
             return
 
         # Check if correct
@@ -1052,15 +1269,14 @@ class ExerciseView(BoxLayout):
 
         # Update stats
         self._total_typed += 1
+        self._stats_dirty = True
 
         if is_correct:
             self._correct_count += 1
 
-            # Clear any pending incorrect chars first (keep only green ones)
-            self._typed_text = self._typed_text[:self._cursor_pos]
-
-            # Add correct char and advance cursor
-            self._typed_text += char
+            # Drop any pending incorrect chars (keep only green ones), add the
+            # correct char and advance cursor
+            self._typed_text = self._typed_text[:self._cursor_pos] + char
             self._cursor_pos += 1
 
             # Update display
@@ -1069,7 +1285,7 @@ class ExerciseView(BoxLayout):
             self.stats.progress_current = self._cursor_pos
 
             # Check if exercise complete
-            if self._cursor_pos >= len(self._target_text):
+            if self._cursor_pos >= self._total_chars:
                 self._complete_exercise()
             elif self._always_show_hint:
                 # Update hint for next target character
@@ -1086,65 +1302,36 @@ class ExerciseView(BoxLayout):
             # Show chord hint popup for the expected character (with wrong buttons in red)
             self._show_chord_hint(expected, pressed_chord)
 
-            # Schedule removal after 2 seconds
-            Clock.schedule_once(self._remove_incorrect_char, 2.0)
-
-    def _show_chord_hint(self, expected_char: str, pressed_mask: int = 0):
-        """Show popup with the correct chord pattern for a character.
+            # Schedule removal after 2 seconds, restarting any pending countdown
+            self._incorrect_trigger.cancel()
+            self._incorrect_trigger()
 
-        Args:
-            expected_char: The character the user should have typed
-            pressed_mask: The chord mask that was actually pressed (for showing wrong buttons in red)
-        """
-        # Find the chord entry for this character
-        chord_mask = 0
-        if self.config:
-            for entry in self.config.entries:
-                if entry.is_keyboard and entry.key_str() == expected_char:
-                    chord_mask = entry.chord_mask
-                    break
+    def _ensure_hint_popup(self) -> Popup:
+        """Build the chord hint popup once; later hints only update its widgets."""
+        if self._hint_view is not None:
+            return self._hint_view
 
         # Create popup content
         content = BoxLayout(orientation='vertical', padding=10, spacing=5)
 
         # Character label at top
-        char_label = Label(
-            text=f'[b]{expected_char}[/b]',
-            markup=True,
+        self._hint_char_label = Label(
+            bold=True,
             font_size='36sp',
             size_hint_y=0.25
         )
-        content.add_widget(char_label)
+        content.add_widget(self._hint_char_label)
 
         # Chord button diagram (shows expected in green, wrong presses in red)
-        chord_widget = ChordHintWidget(chord_mask=chord_mask, pressed_mask=pressed_mask, size_hint_y=0.65)
-        content.add_widget(chord_widget)
+        self._hint_chord_widget = ChordHintWidget(size_hint_y=0.65)
+        content.add_widget(self._hint_chord_widget)
 
-        # Show key labels when in keyboard mode
-        if self._kb_mode and chord_mask:
-            qwerty_keys = []
-            numpad_keys = []
-            for bit in range(20):
-                if chord_mask & (1 << bit):
-                    qk = QWERTY_KEY_LABELS.get(bit)
-                    nk = NUMPAD_KEY_LABELS.get(bit)
-                    if qk:
-                        qwerty_keys.append(qk)
-                    if nk:
-                        numpad_keys.append(nk)
-            hint_parts = []
-            if qwerty_keys:
-                hint_parts.append(' + '.join(qwerty_keys))
-            if numpad_keys:
-                hint_parts.append(' + '.join(numpad_keys))
-            if hint_parts:
-                keys_label = Label(
-                    text='  or  '.join(hint_parts),
-                    font_size='17sp',
-                    color=(0.9, 0.9, 0.5, 1),
-                    size_hint_y=0.1
-                )
-                content.add_widget(keys_label)
+        # Key labels for keyboard mode, only added to content while in use
+        self._hint_keys_label = Label(
+            font_size='17sp',
+            color=(0.9, 0.9, 0.5, 1),
+            size_hint_y=0.1
+        )
 
         # Dismiss hint
         hint_label = Label(
@@ -1155,20 +1342,73 @@ class ExerciseView(BoxLayout):
         )
         content.add_widget(hint_label)
 
-        # Dismiss any existing popup
-        if self._hint_popup:
-            self._hint_popup.dismiss()
-
-        self._hint_popup = Popup(
+        self._hint_view = Popup(
             title='',
             content=content,
             size_hint=(0.35, 0.45),
             auto_dismiss=True,
             separator_height=0
         )
-        self._hint_popup.open()
+        # Tapping outside closes the popup without going through our dismiss paths
+        self._hint_view.bind(on_dismiss=self._on_hint_dismissed)
+        return self._hint_view
+
+    def _on_hint_dismissed(self, popup):
+        """Forget the open hint once it closes, however it was closed."""
+        self._hint_popup = None
+
+    def _dismiss_hint(self):
+        """Close the hint popup without the fade, so it can reopen straight away."""
+        if self._hint_popup:
+            self._hint_popup.dismiss(animation=False)
+            self._hint_popup = None
+
+    def _show_chord_hint(self, expected_char: str, pressed_mask: int = 0):
+        """Show popup with the correct chord pattern for a character.
+
+        Args:
+            expected_char: The character the user should have typed
+            pressed_mask: The chord mask that was actually pressed (for showing wrong buttons in red)
+        """
+        self._sync_chord_caches()
+        chord_mask = self._char_to_mask.get(expected_char, 0)
+        popup = self._ensure_hint_popup()
+
+        self._hint_char_label.text = expected_char
+        self._hint_chord_widget.chord_mask = chord_mask
+        self._hint_chord_widget.pressed_mask = pressed_mask
+
+        # Show key labels when in keyboard mode
+        hint_parts = []
+        if self._kb_mode and chord_mask:
+            qwerty_keys = []
+            numpad_keys = []
+            for bit in range(20):
+                if chord_mask & (1 << bit):
+                    qk = QWERTY_KEY_LABELS.get(bit)
+                    nk = NUMPAD_KEY_LABELS.get(bit)
+                    if qk:
+                        qwerty_keys.append(qk)
+                    if nk:
+                        numpad_keys.append(nk)
+            if qwerty_keys:
+                hint_parts.append(' + '.join(qwerty_keys))
+            if numpad_keys:
+                hint_parts.append(' + '.join(numpad_keys))
+        keys_label = self._hint_keys_label
+        if hint_parts:
+            keys_label.text = '  or  '.join(hint_parts)
+            if keys_label.parent is None:
+                # Between the chord diagram and the dismiss hint
+                popup.content.add_widget(keys_label, index=1)
+        elif keys_label.parent is not None:
+            popup.content.remove_widget(keys_label)
+
+        if self._hint_popup is None:
+            self._hint_popup = popup
+            popup.open()
         # Popup stays open for minimum 1 second, then until all buttons released
-        self._hint_min_time = time.time() + 1.0
+        self._hint_min_time = time.monotonic() + 1.0
 
     def _remove_incorrect_char(self, dt):
         """Remove the last incorrect character after delay"""
@@ -1204,8 +1444,7 @@ class ExerciseView(BoxLayout):
             if word_text:
                 self._word_round_pending = False
                 self._is_word_round = True
-                self._target_text = word_text
-                self._total_chars = len(self._target_text)
+                self._set_target(word_text)
                 self._typed_text = ''
                 self._cursor_pos = 0
                 self._correct_count = 0
@@ -1227,18 +1466,16 @@ class ExerciseView(BoxLayout):
                 return
 
         # Generate new shuffled set for next round
-        perms = self._generate_permutations(self._current_chars)
-        random.shuffle(perms)
+        perms = self._shuffled_combos(self._current_chars)
 
         # If there was a missed char, put combos starting with it first
+        # (stable sort keeps the shuffled order within each group)
         if self._missed_char:
-            missed_perms = [p for p in perms if p.startswith(self._missed_char)]
-            other_perms = [p for p in perms if not p.startswith(self._missed_char)]
-            perms = missed_perms + other_perms
+            missed = self._missed_char
+            perms.sort(key=lambda p: p[0] != missed)
             self._missed_char = None
 
-        self._target_text = ''.join(perms)
-        self._total_chars = len(self._target_text)
+        self._set_target(''.join(perms))
         self._typed_text = ''
         self._cursor_pos = 0
         self._correct_count = 0
@@ -535,10 +535,8 @@ class ChordTable(BoxLayout):
         if not config:
             return
 
-        # Sort by chord mask
-        sorted_entries = sorted(config.entries, key=lambda e: e.chord_mask)
-
-        for entry in sorted_entries:
+        # Ordered by chord mask
+        for entry in config.sorted_entries():
             if entry.is_keyboard:
                 row = ChordTableRow(entry.chord_str(), entry.key_str())
                 self.container.add_widget(row)
@@ -7,12 +7,26 @@ Works independently of USB CDC - only requires JLink connection.
 
 import re
 import subprocess
+import sys
 import threading
 import time
+from array import array
 from dataclasses import dataclass, field
 from typing import Callable, Optional, List
 from queue import Queue, Empty
 
+# RAW2D position/size values are 16-bit big-endian, 0xFFFF marks an empty slot
+_SWAP_U16 = sys.byteorder == 'little'
+
+
+def _parse_positions(hex_str: str) -> List[int]:
+    """Parse hex bytes (16-bit BE values) to list of ints, skipping empty slots."""
+    # Drop any trailing partial value so fromhex and array see whole u16s
+    values = array('H', bytes.fromhex(hex_str[:len(hex_str) // 4 * 4]))
+    if _SWAP_U16:
+        values.byteswap()
+    return [v for v in values if v != 0xFFFF]
+
 
 @dataclass
 class TrillTouch2D:
@@ -65,6 +79,10 @@ class Raw2DEvent:
     y_bytes: str = ""
     x_bytes: str = ""
     size_bytes: str = ""
+    # Decoded values, parsed on the reader thread
+    y_vals: List[int] = field(default_factory=list)
+    x_vals: List[int] = field(default_factory=list)
+    s_vals: List[int] = field(default_factory=list)
 
 
 class RTTReader:
@@ -317,7 +335,10 @@ class RTTReader:
                 header=match.group(1),
                 y_bytes=match.group(2),
                 x_bytes=match.group(3),
-                size_bytes=match.group(4)
+                size_bytes=match.group(4),
+                y_vals=_parse_positions(match.group(2)),
+                x_vals=_parse_positions(match.group(3)),
+                s_vals=_parse_positions(match.group(4))
             )
             self.last_raw2d = event
             if self.on_raw2d:
@@ -4,6 +4,8 @@
 Used by the Learn tab to generate word-based practice rounds.
 """
 
+import functools
+
 WORD_LIST = tuple("""
 ad ah am an as at be by do go he hi if in is it me my no of oh ok on or so to up us we
 ace act add age ago aid aim air all and ant any are arm art ask ate awe axe
@@ -144,3 +146,25 @@ umbrella uncommon universe unlikely unmarked upcoming
 valuable variable ventures versions veterans vicinity violence volatile
 wandered weakness whatever whenever wherever wildlife wireless withdraw workshop
 """.split())
+
+# One bit per lowercase letter; WORD_LIST words only use a-z
+_LETTER_BITS = {chr(ord('a') + i): 1 << i for i in range(26)}
+
+
+def letter_mask(chars) -> int:
+    """Bitmask of the a-z letters in chars (anything else is ignored)."""
+    mask = 0
+    for c in chars:
+        mask |= _LETTER_BITS.get(c, 0)
+    return mask
+
+
+# Letter masks per word, built once so filtering is one AND per word
+_WORD_MASKS = tuple((word, letter_mask(word)) for word in WORD_LIST)
+
+
+@functools.lru_cache(maxsize=64)
+def words_for_letters(letters: int) -> tuple:
+    """Words from WORD_LIST spelled only with the letters in a letter_mask."""
+    missing = ~letters
+    return tuple(word for word, mask in _WORD_MASKS if not mask & missing)
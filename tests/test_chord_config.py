@@ -0,0 +1,131 @@
+"""Tests for the GUI chord config model (ChordConfig)."""
+
+import pytest
+
+pytest.importorskip('kivy')
+
+from nchorder_tools.gui.chord_view import ChordConfig, ChordEntry
+
+
+KEYBOARD = 0x0002  # Event type in the low byte of the modifier field
+
+
+def assert_sorted_in_step(config):
+    """sorted_entries() must match a fresh sort of entries."""
+    assert config.sorted_entries() == sorted(config.entries, key=lambda e: e.chord_mask)
+
+
+def unused_mask(config):
+    """A chord mask not present in the config."""
+    used = {e.chord_mask for e in config.entries}
+    return next(m for m in range(1, 1 << 20) if m not in used)
+
+
+@pytest.fixture(params=['mirrorwalk.cfg', 'mirrorwalk_nomcc.cfg', '1.cfg'])
+def cfg_path(request, configs_dir):
+    """Path to a bundled binary config."""
+    path = configs_dir / request.param
+    if not path.exists():
+        pytest.skip(f"Config not found: {path}")
+    return path
+
+
+class TestChordConfig:
+    """Tests for ChordConfig edits keeping sorted_entries in step."""
+
+    def test_load(self, cfg_path):
+        """Loading populates entries in mask order."""
+        config = ChordConfig()
+        assert config.load(str(cfg_path))
+        assert len(config.entries) > 0
+        assert_sorted_in_step(config)
+
+    def test_add(self, cfg_path):
+        """Adding a new mask inserts it into the sorted view."""
+        config = ChordConfig()
+        config.load(str(cfg_path))
+        config.sorted_entries()
+        count = len(config.entries)
+
+        entry = ChordEntry(unused_mask(config), KEYBOARD, 0x04)
+        config.add_or_update(entry)
+
+        assert len(config.entries) == count + 1
+        assert config.find_chord(entry.chord_mask) is entry
+        assert_sorted_in_step(config)
+
+    def test_update_changed_key(self, cfg_path):
+        """Updating an existing mask replaces the entry in place."""
+        config = ChordConfig()
+        config.load(str(cfg_path))
+        config.sorted_entries()
+        count = len(config.entries)
+        old = config.entries[len(config.entries) // 2]
+
+        entry = ChordEntry(old.chord_mask, KEYBOARD, 0x05 if old.keycode != 0x05 else 0x06)
+        config.add_or_update(entry)
+
+        assert len(config.entries) == count
+        assert config.find_chord(old.chord_mask) is entry
+        assert old not in config.sorted_entries()
+        assert_sorted_in_step(config)
+
+    def test_remove(self, cfg_path):
+        """Removing a mask drops it from the sorted view."""
+        config = ChordConfig()
+        config.load(str(cfg_path))
+        config.sorted_entries()
+        count = len(config.entries)
+        mask = config.entries[0].chord_mask
+
+        assert config.remove(mask)
+        assert len(config.entries) == count - 1
+        assert_sorted_in_step(config)
+        assert not config.remove(unused_mask(config))
+
+    def test_edit_sequence_and_reload(self, cfg_path, tmp_path):
+        """A run of edits stays in step and survives save and reload."""
+        config = ChordConfig()
+        config.load(str(cfg_path))
+        assert_sorted_in_step(config)
+
+        added = ChordEntry(unused_mask(config), KEYBOARD, 0x04)
+        config.add_or_update(added)
+        assert_sorted_in_step(config)
+
+        config.add_or_update(ChordEntry(added.chord_mask, KEYBOARD, 0x07))
+        assert_sorted_in_step(config)
+
+        config.remove(config.entries[0].chord_mask)
+        assert_sorted_in_step(config)
+
+        out = tmp_path / 'edited.cfg'
+        assert config.save(str(out))
+        expected = [(e.chord_mask, e.modifier, e.keycode) for e in config.entries]
+
+        # Reload into the same object replaces the edited state
+        assert config.load(str(out))
+        assert [(e.chord_mask, e.modifier, e.keycode) for e in config.entries] == expected
+        assert config.find_chord(added.chord_mask).keycode == 0x07
+        assert_sorted_in_step(config)
+
+        assert config.load(str(cfg_path))
+        assert config.find_chord(added.chord_mask) is None
+        assert_sorted_in_step(config)
+
+    def test_revision_bumped_by_edits(self, cfg_path):
+        """load, add_or_update and remove each bump the revision."""
+        config = ChordConfig()
+        assert config.load(str(cfg_path))
+        revision = config.revision
+
+        config.add_or_update(ChordEntry(unused_mask(config), KEYBOARD, 0x04))
+        assert config.revision > revision
+        revision = config.revision
+
+        config.remove(config.entries[0].chord_mask)
+        assert config.revision > revision
+        revision = config.revision
+
+        assert not config.remove(unused_mask(config))
+        assert config.revision == revision
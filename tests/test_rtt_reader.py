@@ -0,0 +1,61 @@
+"""Tests for RTT reader payload decoding."""
+
+import struct
+
+import pytest
+from nchorder_tools.rtt_reader import _parse_positions
+
+
+def struct_parse_positions(hex_str):
+    """Reference decoder: whole big-endian u16s via struct.unpack, 0xFFFF dropped."""
+    raw = bytes.fromhex(hex_str[:len(hex_str) // 4 * 4])
+    values = struct.unpack(f'>{len(raw) // 2}H', raw)
+    return [v for v in values if v != 0xFFFF]
+
+
+class TestParsePositions:
+    """Tests for _parse_positions RAW2D hex decoding."""
+
+    def test_big_endian(self):
+        """Values are read most significant byte first."""
+        assert _parse_positions('0102') == [0x0102]
+        assert _parse_positions('00ff0100') == [0x00FF, 0x0100]
+        assert _parse_positions('fffe0001') == [0xFFFE, 0x0001]
+
+    def test_skips_empty_slots(self):
+        """0xFFFF marks an empty slot and is dropped."""
+        assert _parse_positions('ffff0010ffff0020ffff') == [0x0010, 0x0020]
+        assert _parse_positions('ffffffffffffffffffff') == []
+
+    def test_uppercase_hex(self):
+        """Firmware may print either case."""
+        assert _parse_positions('ABCD') == [0xABCD]
+
+    @pytest.mark.parametrize('hex_str', ['', '0', '01', '012'])
+    def test_short_input(self, hex_str):
+        """Empty input or less than one whole value decodes to nothing."""
+        assert _parse_positions(hex_str) == []
+
+    @pytest.mark.parametrize('hex_str', ['01020', '010203', '0102030', 'ffff01'])
+    def test_trailing_partial_value_ignored(self, hex_str):
+        """Odd-length and truncated payloads drop the trailing partial value."""
+        assert _parse_positions(hex_str) == struct_parse_positions(hex_str)
+        assert len(_parse_positions(hex_str)) <= len(hex_str) // 4
+
+    @pytest.mark.parametrize('hex_str', [
+        '',
+        '0000',
+        '00010002000300040005',
+        '0123456789abcdefffff',
+        'ffff0000ffff7fff8000',
+        '1234567',
+        'fedcba9876543210f',
+    ])
+    def test_matches_struct_unpack(self, hex_str):
+        """Decoding agrees with the struct.unpack reference."""
+        assert _parse_positions(hex_str) == struct_parse_positions(hex_str)
+
+    def test_matches_struct_unpack_all_byte_pairs(self):
+        """Every u16 value decodes the same as struct.unpack."""
+        hex_str = ''.join(f'{v:04x}' for v in range(0, 0x10000, 7)) + 'ffff'
+        assert _parse_positions(hex_str) == struct_parse_positions(hex_str)
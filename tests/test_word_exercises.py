@@ -46,20 +46,66 @@ class TestWordList:
         assert len(present) >= 15, f"Missing common words: {common - present}"
 
 
+class TestLetterMask:
+    """Tests for letter_mask and words_for_letters."""
+
+    @staticmethod
+    def set_filter(chars):
+        """Reference filter: words whose letters are all in chars."""
+        from nchorder_tools.wordlist import WORD_LIST
+        return tuple(w for w in WORD_LIST if set(w) <= chars)
+
+    def test_letter_mask_bits(self):
+        from nchorder_tools.wordlist import letter_mask
+        assert letter_mask('') == 0
+        assert letter_mask('a') == 1
+        assert letter_mask('z') == 1 << 25
+        assert letter_mask('abca') == 0b111
+
+    def test_letter_mask_ignores_non_letters(self):
+        """Space, digits, punctuation and uppercase set no bits."""
+        from nchorder_tools.wordlist import letter_mask
+        assert letter_mask(' 09.,;\'-!?') == 0
+        assert letter_mask('AZ') == 0
+        assert letter_mask({'e', ' ', '1', '.'}) == letter_mask('e')
+
+    @pytest.mark.parametrize('chars', [
+        set(),
+        {' '},
+        {'e', 't', 'a'},
+        {'z', 'x'},
+        set('etaoinshrd'),
+        set('etaoinshrd '),
+        set('etaoin 0123456789'),
+        set('etaoinshrd.,;:\'-!?'),
+        set('ETAOINshrd'),
+        set('abcdefghijklmnopqrstuvwxyz'),
+        set('abcdefghijklmnopqrstuvwxyz .,'),
+    ])
+    def test_matches_set_filter(self, chars):
+        """Bitmask filtering agrees with the set-based filter, in list order."""
+        from nchorder_tools.wordlist import letter_mask, words_for_letters
+        assert words_for_letters(letter_mask(chars)) == self.set_filter(chars)
+
+    def test_all_letters_returns_every_word(self):
+        from nchorder_tools.wordlist import WORD_LIST, letter_mask, words_for_letters
+        assert words_for_letters(letter_mask('abcdefghijklmnopqrstuvwxyz')) == WORD_LIST
+
+
 class TestWordFiltering:
     """Tests for _get_words_for_chars and _generate_word_round methods."""
 
     def _make_exercise_view(self):
         """Create a minimal ExerciseView-like object with word methods.
 
-        Avoids Kivy import by testing the logic directly.
+        Avoids Kivy import by using the same wordlist helpers as ExerciseView.
         """
         import random
-        from nchorder_tools.wordlist import WORD_LIST
+        from nchorder_tools.wordlist import letter_mask, words_for_letters
 
         class MockExerciseView:
             def _get_words_for_chars(self, chars: set) -> list:
-                return [w for w in WORD_LIST if set(w) <= chars]
+                return list(words_for_letters(letter_mask(chars)))
 
             def _generate_word_round(self, chars: set) -> str:
                 words = self._get_words_for_chars(chars)